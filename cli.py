@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
-import argparse
 import asyncio
 import json
+import logging
+import os
 import sys
 from pathlib import Path
 
 from gemini_automation.config import Config
-from gemini_automation.browser import BrowserManager
-from gemini_automation.generator import ImageGenerator
-from gemini_automation.downloader import ImageDownloader
-from gemini_automation.overlay import BrowserOverlay
+
+# Playwright-backed modules are imported inside each command so that
+# --help, argument errors and an empty-profile `status` stay fast.
 
 
 async def cmd_login(config: Config) -> int:
     """Open browser for manual Google login."""
+    from gemini_automation.browser import BrowserManager
+
     async with BrowserManager(config) as bm:
         success = await bm.wait_for_login(timeout_seconds=300)
         if success:
@@ -27,8 +29,11 @@ async def cmd_login(config: Config) -> int:
             return 1
 
 
-async def cmd_status(config: Config) -> int:
-    """Check login state and show project info."""
+async def cmd_status(config: Config, quick: bool = False) -> int:
+    """Check login state and show project info.
+
+    With ``quick`` the browser is never launched; only local state is shown.
+    """
     profile_exists = config.profile_dir.exists() and any(config.profile_dir.iterdir())
     print(f"Profile dir: {config.profile_dir}")
     print(f"Output dir:  {config.output_dir}")
@@ -38,25 +43,39 @@ async def cmd_status(config: Config) -> int:
         print("Logged in: NO")
         return 0
 
-    print("Profile: exists")
+    if quick:
+        print("Profile: exists (use 'python cli.py status' to verify login)")
+    else:
+        print("Profile: exists")
 
-    async with BrowserManager(config) as bm:
-        page = await bm.get_page()
-        logged_in = await bm.is_logged_in(page)
-        print(f"Logged in: {'YES' if logged_in else 'NO'}")
+        from gemini_automation.browser import BrowserManager
+
+        async with BrowserManager(config) as bm:
+            page = await bm.get_page()
+            logged_in = await bm.is_logged_in(page, wait_until="commit")
+            print(f"Logged in: {'YES' if logged_in else 'NO'}")
 
     # Count images in output
-    image_count = len(list(config.output_dir.glob("*.png"))) + len(
-        list(config.output_dir.glob("*.jpg"))
-    )
+    try:
+        with os.scandir(config.output_dir) as entries:
+            image_count = sum(
+                1 for e in entries if e.name.endswith((".png", ".jpg")) and e.is_file()
+            )
+    except FileNotFoundError:
+        image_count = 0
     print(f"Images in output: {image_count}")
     return 0
 
 
 async def cmd_generate(
-    config: Config, prompts: list[str], output_dir: Path | None
+    config: Config, prompts: list[str], output_dir: Path | None, tabs: int = 1
 ) -> int:
     """Generate images for given prompts."""
+    from gemini_automation.browser import BrowserManager
+    from gemini_automation.downloader import ImageDownloader
+    from gemini_automation.generator import ImageGenerator
+    from gemini_automation.overlay import BrowserOverlay
+
     if output_dir:
         config.output_dir = output_dir
     config.ensure_dirs()
@@ -76,9 +95,18 @@ async def cmd_generate(
         downloader = ImageDownloader(page, config)
 
         # Generate images
-        gen_results = await generator.generate_batch(prompts)
+        gen_results = await generator.generate_batch_parallel(prompts, tabs)
+
+        # Download images for all successful prompts concurrently
+        successes = [g for g in gen_results if g.success]
+        try:
+            dl_results = await asyncio.gather(
+                *(downloader.download_all(g) for g in successes)
+            )
+        finally:
+            await downloader.close()
+        dl_iter = iter(dl_results)
 
-        # Download images
         all_results = []
         for gen_result in gen_results:
             entry = {
@@ -88,7 +116,7 @@ async def cmd_generate(
                 "error": gen_result.error,
             }
             if gen_result.success:
-                dl_result = await downloader.download_all(gen_result)
+                dl_result = next(dl_iter)
                 entry["images"] = [str(p) for p in dl_result.saved_files]
                 if dl_result.failed_urls:
                     entry["download_failures"] = len(dl_result.failed_urls)
@@ -109,53 +137,116 @@ async def cmd_generate(
     return 0 if failed == 0 else 1
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Gemini web image generation automation"
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # login
-    subparsers.add_parser("login", help="Open browser for manual Google login")
-
-    # generate
-    gen_parser = subparsers.add_parser("generate", help="Generate images from prompts")
-    gen_parser.add_argument(
-        "--prompts", nargs="+", required=True, help="List of text prompts"
-    )
-    gen_parser.add_argument(
-        "--output-dir",
-        type=Path,
-        default=None,
-        help="Output directory (default: ./output)",
-    )
-
-    # status
-    subparsers.add_parser("status", help="Check login state and project info")
-
-    # tui
-    subparsers.add_parser("tui", help="Launch interactive TUI")
-
-    args = parser.parse_args()
-
-    if not args.command:
-        parser.print_help()
+USAGE = """\
+usage: cli.py <command> [options]
+
+Gemini web image generation automation
+
+commands:
+  login                 Open browser for manual Google login
+  generate              Generate images from prompts
+      --prompts P [P ...]   List of text prompts (required)
+      --output-dir DIR      Output directory (default: ./output)
+      --tabs N              Chat tabs to run prompts in at once (default: 1)
+  status                Check login state and project info
+      --quick               Skip the browser login check
+  tui                   Launch interactive TUI
+"""
+
+
+def _usage_error(message: str) -> int:
+    """Print usage plus an error message to stderr and return exit code 2."""
+    print(USAGE, file=sys.stderr, end="")
+    print(f"cli.py: error: {message}", file=sys.stderr)
+    return 2
+
+
+def _parse_generate_args(
+    argv: list[str],
+) -> tuple[list[str], Path | None, int] | str:
+    """Parse ``generate`` options.
+
+    Returns (prompts, output_dir, tabs) or an error string.
+    """
+    prompts: list[str] = []
+    output_dir: Path | None = None
+    tabs = 1
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--prompts":
+            i += 1
+            while i < len(argv) and not argv[i].startswith("--"):
+                prompts.append(argv[i])
+                i += 1
+            continue
+        if arg == "--output-dir" or arg.startswith("--output-dir="):
+            if "=" in arg:
+                value = arg.split("=", 1)[1]
+            elif i + 1 < len(argv):
+                i += 1
+                value = argv[i]
+            else:
+                return "argument --output-dir: expected one argument"
+            output_dir = Path(value)
+            i += 1
+            continue
+        if arg == "--tabs" or arg.startswith("--tabs="):
+            if "=" in arg:
+                value = arg.split("=", 1)[1]
+            elif i + 1 < len(argv):
+                i += 1
+                value = argv[i]
+            else:
+                return "argument --tabs: expected one argument"
+            if not value.isdigit() or int(value) < 1:
+                return f"argument --tabs: invalid positive int value: '{value}'"
+            tabs = int(value)
+            i += 1
+            continue
+        return f"unrecognized arguments: {' '.join(argv[i:])}"
+    if not prompts:
+        return "the following arguments are required: --prompts"
+    return prompts, output_dir, tabs
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv:
+        print(USAGE, end="")
         return 1
+    command, rest = argv[0], argv[1:]
+    if command in ("-h", "--help") or "-h" in rest or "--help" in rest:
+        print(USAGE, end="")
+        return 0
+    if command not in ("login", "generate", "status", "tui"):
+        return _usage_error(f"invalid command '{command}'")
+
+    if command == "generate":
+        parsed = _parse_generate_args(rest)
+        if isinstance(parsed, str):
+            return _usage_error(parsed)
+        prompts, output_dir, tabs = parsed
+    elif command == "status" and rest == ["--quick"]:
+        pass
+    elif rest:
+        return _usage_error(f"unrecognized arguments: {' '.join(rest)}")
+
+    # Progress from the generators goes through logging; show it as plain
+    # lines on stdout like the rest of the CLI output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     config = Config.from_defaults()
     config.ensure_dirs()
 
-    if args.command == "tui":
+    if command == "tui":
         return cmd_tui()
-    elif args.command == "login":
+    if command == "login":
         return asyncio.run(cmd_login(config))
-    elif args.command == "generate":
-        return asyncio.run(cmd_generate(config, args.prompts, args.output_dir))
-    elif args.command == "status":
-        return asyncio.run(cmd_status(config))
-    else:
-        parser.print_help()
-        return 1
+    if command == "generate":
+        return asyncio.run(cmd_generate(config, prompts, output_dir, tabs))
+    return asyncio.run(cmd_status(config, quick="--quick" in rest))
 
 
 def cmd_tui() -> int:
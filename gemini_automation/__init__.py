@@ -1,12 +1,41 @@
 """Gemini web image generation automation."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from gemini_automation.config import Config
-from gemini_automation.browser import BrowserManager
-from gemini_automation.generator import ImageGenerator, GenerationResult
-from gemini_automation.downloader import ImageDownloader, DownloadResult
-from gemini_automation.accounts import Account, AccountManager
+if TYPE_CHECKING:
+    from gemini_automation.config import Config
+    from gemini_automation.browser import BrowserManager
+    from gemini_automation.generator import ImageGenerator, GenerationResult
+    from gemini_automation.downloader import ImageDownloader, DownloadResult
+    from gemini_automation.accounts import Account, AccountManager
+
+# Public names are resolved on first access so that importing a light
+# submodule (e.g. config) does not drag in Playwright.
+_LAZY_EXPORTS = {
+    "Config": "gemini_automation.config",
+    "BrowserManager": "gemini_automation.browser",
+    "ImageGenerator": "gemini_automation.generator",
+    "GenerationResult": "gemini_automation.generator",
+    "ImageDownloader": "gemini_automation.downloader",
+    "DownloadResult": "gemini_automation.downloader",
+    "Account": "gemini_automation.accounts",
+    "AccountManager": "gemini_automation.accounts",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Config",
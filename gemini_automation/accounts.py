@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import shutil
+import stat
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timezone
 from pathlib import Path
 
+from gemini_automation.config import resolve_profile_dir
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 _NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
 
@@ -31,20 +42,81 @@ class AccountManager:
         self.profiles_dir = base / "gemini_profiles"
         self.accounts_file = base / "accounts.json"
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed accounts.json (plus a name index), reused until the file's
+        # mtime changes
+        self._cache: list[Account] | None = None
+        self._cache_by_name: dict[str, Account] = {}
+        self._cache_mtime: int = 0
+        # The TUI saves from worker threads as well as the event loop; this
+        # serializes every read-modify-write of accounts.json and the cache.
+        self._lock = threading.RLock()
+
+    def _cached(self) -> dict[str, Account]:
+        """Return the name→Account index, re-reading accounts.json if it changed.
+
+        The returned objects are shared with the cache and must not be mutated.
+        """
+        with self._lock:
+            try:
+                mtime = self.accounts_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._set_cache([], 0)
+                return self._cache_by_name
+            if self._cache is None or mtime != self._cache_mtime:
+                raw = self.accounts_file.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                self._set_cache([Account(**a) for a in data.get("accounts", [])], mtime)
+            return self._cache_by_name
+
+    def _set_cache(self, accounts: list[Account], mtime: int) -> None:
+        """Replace the cached account list and rebuild the name index."""
+        self._cache = accounts
+        self._cache_by_name = {a.name: a for a in accounts}
+        self._cache_mtime = mtime
 
     def load(self) -> list[Account]:
-        """Load accounts from JSON file."""
-        if not self.accounts_file.exists():
-            return []
-        with open(self.accounts_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return [Account(**a) for a in data.get("accounts", [])]
+        """Load accounts from JSON file (cached until the file changes)."""
+        with self._lock:
+            self._cached()
+            return [replace(a) for a in self._cache]
+
+    def _file_mode(self) -> int:
+        """accounts.json's current mode bits, or the umask default if it's new."""
+        try:
+            return stat.S_IMODE(self.accounts_file.stat().st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
 
     def save(self, accounts: list[Account]) -> None:
         """Save accounts to JSON file."""
-        data = {"accounts": [asdict(a) for a in accounts]}
-        with open(self.accounts_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson:
+            # orjson serializes dataclasses natively, no asdict() round-trip
+            raw = orjson.dumps({"accounts": accounts}, option=orjson.OPT_INDENT_2)
+        else:
+            data = {"accounts": [asdict(a) for a in accounts]}
+            raw = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            # Write to a uniquely named sibling temp file and swap it in, so
+            # a crash mid-write never leaves a truncated accounts.json behind.
+            with tempfile.NamedTemporaryFile(
+                dir=self.accounts_file.parent,
+                prefix="accounts.",
+                suffix=".json.tmp",
+                delete=False,
+            ) as f:
+                f.write(raw)
+            try:
+                # NamedTemporaryFile is 0600; keep accounts.json's own mode
+                os.chmod(f.name, self._file_mode())
+                os.replace(f.name, self.accounts_file)
+            except BaseException:
+                os.unlink(f.name)
+                raise
+            self._set_cache(
+                [replace(a) for a in accounts], self.accounts_file.stat().st_mtime_ns
+            )
 
     def create(self, name: str) -> Account:
         """Create a new account. Raises ValueError on invalid/duplicate name."""
@@ -52,27 +124,29 @@ class AccountManager:
             raise ValueError(
                 f"Invalid account name '{name}'. Use alphanumeric, hyphens, underscores only."
             )
-        accounts = self.load()
-        if any(a.name == name for a in accounts):
-            raise ValueError(f"Account '{name}' already exists.")
-
-        profile_dir = self.profiles_dir / name
-        profile_dir.mkdir(parents=True, exist_ok=True)
-
-        account = Account(
-            name=name,
-            profile_dir=str(profile_dir),
-            created_at=datetime.now(timezone.utc).isoformat(),
-        )
-        accounts.append(account)
-        self.save(accounts)
+        with self._lock:
+            if name in self._cached():
+                raise ValueError(f"Account '{name}' already exists.")
+            accounts = self.load()
+
+            profile_dir = self.profiles_dir / name
+            profile_dir.mkdir(parents=True, exist_ok=True)
+
+            account = Account(
+                name=name,
+                profile_dir=str(profile_dir),
+                created_at=datetime.now(timezone.utc).isoformat(),
+            )
+            accounts.append(account)
+            self.save(accounts)
         return account
 
     def remove(self, name: str) -> None:
         """Remove account and delete its profile directory."""
-        accounts = self.load()
-        accounts = [a for a in accounts if a.name != name]
-        self.save(accounts)
+        with self._lock:
+            accounts = self.load()
+            accounts = [a for a in accounts if a.name != name]
+            self.save(accounts)
 
         profile_dir = self.profiles_dir / name
         if profile_dir.exists():
@@ -85,26 +159,50 @@ class AccountManager:
                         time.sleep(1)
                     else:
                         raise
+        resolve_profile_dir.cache_clear()
 
     def get(self, name: str) -> Account | None:
         """Look up account by name."""
-        for a in self.load():
-            if a.name == name:
-                return a
-        return None
+        with self._lock:
+            account = self._cached().get(name)
+            return replace(account) if account else None
 
     def list_accounts(self) -> list[Account]:
         """Return all accounts."""
         return self.load()
 
-    def update_last_used(self, name: str) -> None:
-        """Update last_used timestamp for an account."""
-        accounts = self.load()
-        for a in accounts:
-            if a.name == name:
-                a.last_used = datetime.now(timezone.utc).isoformat()
-                break
-        self.save(accounts)
+    def update_last_used(self, *names: str) -> None:
+        """Update the last_used timestamp of one or more accounts.
+
+        All of them are written in one save. Accounts that are unknown or
+        were already touched within the last second are skipped, and
+        nothing is written if that leaves none.
+        """
+        with self._lock:
+            by_name = self._cached()
+            now = datetime.now(timezone.utc)
+            stale = set()
+            for name in names:
+                current = by_name.get(name)
+                if current is None:
+                    continue
+                if current.last_used:
+                    try:
+                        previous = datetime.fromisoformat(current.last_used)
+                        if (now - previous).total_seconds() < 1:
+                            continue
+                    except ValueError:
+                        pass
+                stale.add(name)
+            if not stale:
+                return
+            stamp = now.isoformat()
+            self.save(
+                [
+                    replace(a, last_used=stamp) if a.name in stale else a
+                    for a in self._cache
+                ]
+            )
 
     def get_profile_dir(self, name: str) -> Path:
         """Return profile directory path for an account."""
@@ -4,12 +4,49 @@ from __future__ import annotations
 
 import asyncio
 import shutil
+import time
 from pathlib import Path
-from playwright.async_api import async_playwright, BrowserContext, Page, Playwright
+from playwright.async_api import (
+    async_playwright,
+    BrowserContext,
+    Page,
+    Playwright,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 from gemini_automation.config import Config
 
 
+def _rmtree_with_retry(path: Path, attempts: int = 3) -> None:
+    """Delete a directory tree, retrying while Chrome releases file locks."""
+    for attempt in range(attempts):
+        try:
+            shutil.rmtree(path)
+            return
+        except PermissionError:
+            if attempt < attempts - 1:
+                time.sleep(1)
+            else:
+                raise
+
+
+async def is_logged_in(
+    page: Page, config: Config, wait_until: str = "domcontentloaded"
+) -> bool:
+    """Check if ``page`` is logged in to Gemini by looking for the textarea.
+
+    ``wait_until="commit"`` returns from navigation as soon as the
+    response starts; the textarea wait then covers the rest of the load.
+    """
+    try:
+        await page.goto(config.gemini_url, wait_until=wait_until)
+        textarea = page.locator(config.selectors["textarea"])
+        await textarea.wait_for(state="visible", timeout=15_000)
+        return True
+    except Exception:
+        return False
+
+
 class BrowserManager:
     """Manages a persistent Chrome browser context with anti-detection."""
 
@@ -17,6 +54,7 @@ class BrowserManager:
         self.config = config
         self._playwright: Playwright | None = None
         self._context: BrowserContext | None = None
+        self._page: Page | None = None
 
     async def __aenter__(self) -> "BrowserManager":
         await self.launch()
@@ -30,7 +68,7 @@ class BrowserManager:
         self.config.ensure_dirs()
         self._playwright = await async_playwright().start()
         self._context = await self._playwright.chromium.launch_persistent_context(
-            user_data_dir=str(self.config.profile_dir.resolve()),
+            user_data_dir=str(self.config.resolved_profile_dir),
             channel="chrome",
             headless=False,
             args=self.config.browser_args,
@@ -39,16 +77,18 @@ class BrowserManager:
         )
 
     async def get_page(self) -> Page:
-        """Return first existing page or create a new one."""
+        """Return first existing page or create a new one (cached)."""
         if not self._context:
             raise RuntimeError("Browser not launched. Call launch() first.")
+        if self._page is not None and not self._page.is_closed():
+            return self._page
         pages = self._context.pages
-        if pages:
-            return pages[0]
-        return await self._context.new_page()
+        self._page = pages[0] if pages else await self._context.new_page()
+        return self._page
 
     async def close(self) -> None:
         """Gracefully shut down browser context and playwright."""
+        self._page = None
         if self._context:
             await self._context.close()
             self._context = None
@@ -56,20 +96,16 @@ class BrowserManager:
             await self._playwright.stop()
             self._playwright = None
 
-    async def is_logged_in(self, page: Page | None = None) -> bool:
-        """Check if user is logged in to Gemini by looking for the textarea."""
+    async def is_logged_in(
+        self, page: Page | None = None, wait_until: str = "domcontentloaded"
+    ) -> bool:
+        """Check if user is logged in to Gemini (see ``is_logged_in``)."""
         if page is None:
             page = await self.get_page()
-        try:
-            await page.goto(self.config.gemini_url, wait_until="domcontentloaded")
-            textarea = page.locator(self.config.selectors["textarea"])
-            await textarea.wait_for(state="visible", timeout=15_000)
-            return True
-        except Exception:
-            return False
+        return await is_logged_in(page, self.config, wait_until)
 
     async def wait_for_login(self, timeout_seconds: float = 300) -> bool:
-        """Navigate to Gemini and poll until user logs in manually.
+        """Navigate to Gemini and wait until user logs in manually.
 
         Returns True if login detected, False on timeout.
         """
@@ -78,17 +114,14 @@ class BrowserManager:
         print("Please log in to your Google account in the browser window...")
         print(f"Waiting up to {int(timeout_seconds)}s for login...")
 
-        elapsed = 0.0
-        poll_interval = 3.0
-        while elapsed < timeout_seconds:
-            try:
-                textarea = page.locator(self.config.selectors["textarea"])
-                await textarea.wait_for(state="visible", timeout=5_000)
-                return True
-            except Exception:
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
-        return False
+        textarea = page.locator(self.config.selectors["textarea"])
+        try:
+            await textarea.wait_for(
+                state="visible", timeout=int(timeout_seconds * 1000)
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
     async def wait_for_login_interactive(self) -> bool:
         """Navigate to Gemini and keep browser open for manual login.
@@ -104,13 +137,7 @@ class BrowserManager:
     async def logout(self) -> None:
         """Close browser and delete profile directory to clear login state."""
         await self.close()
+        self.config.invalidate_dirs()
         if self.config.profile_dir.exists():
-            for attempt in range(3):
-                try:
-                    shutil.rmtree(self.config.profile_dir)
-                    break
-                except PermissionError:
-                    if attempt < 2:
-                        await asyncio.sleep(1)
-                    else:
-                        raise
+            # Chrome profiles hold many small files; keep the event loop free
+            await asyncio.to_thread(_rmtree_with_retry, self.config.profile_dir)
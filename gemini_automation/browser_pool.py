@@ -0,0 +1,207 @@
+"""Reusable Chrome contexts for multi-account generation."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+from gemini_automation.config import Config
+
+# Contexts are closed and relaunched after this many checkouts, so a
+# long-lived pool does not keep one Chrome process forever.
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("BROWSER_POOL_RECYCLE_AFTER", "100"))
+
+
+async def _close_context(context: BrowserContext) -> None:
+    """Close ``context``; the close carries on even if the caller is cancelled."""
+    try:
+        await asyncio.shield(asyncio.wait_for(context.close(), timeout=10))
+    except Exception:
+        pass
+
+
+class BrowserPool:
+    """Keeps launched account browsers open between batches.
+
+    Contexts are keyed by profile directory. acquire() hands out an idle
+    context for the profile or launches one; release() puts it back, or
+    closes it once it has been used ``recycle_after`` times. Chrome locks a
+    profile to one process, so each profile has at most one context: while
+    it is checked out, another acquire() for the profile waits for it.
+
+    With ``config.use_shared_browser``, profiles that have a saved
+    storage_state become contexts of one shared Chrome process instead of a
+    Chrome each; their state is saved back whenever they are released.
+    Profiles without a snapshot yet still launch persistently (that run
+    writes the snapshot).
+    """
+
+    def __init__(self, recycle_after: int = BROWSER_POOL_RECYCLE_AFTER) -> None:
+        self.recycle_after = recycle_after
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._start_lock = asyncio.Lock()
+        self._idle: dict[Path, asyncio.Queue[BrowserContext]] = {}
+        self._uses: dict[BrowserContext, int] = {}
+        # One slot per profile, held from acquire() until release() (or
+        # until the checked-out context closes)
+        self._slots: dict[Path, asyncio.Semaphore] = {}
+        self._checked_out: dict[BrowserContext, Path] = {}
+        # Closers for launches whose acquire() was cancelled mid-launch
+        self._cleanups: set[asyncio.Task] = set()
+
+    async def _get_playwright(self) -> Playwright:
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            return self._playwright
+
+    async def _get_browser(self, config: Config) -> Browser:
+        pw = await self._get_playwright()
+        async with self._start_lock:
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = await pw.chromium.launch(
+                    channel="chrome", headless=False, args=config.batch_browser_args
+                )
+            return self._browser
+
+    def _slot(self, key: Path) -> asyncio.Semaphore:
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = asyncio.Semaphore(1)
+        return slot
+
+    def _free_slot(self, context: BrowserContext) -> None:
+        """Give up ``context``'s profile slot, if it is checked out."""
+        key = self._checked_out.pop(context, None)
+        if key is not None:
+            self._slot(key).release()
+
+    def _forget(self, context: BrowserContext) -> None:
+        self._uses.pop(context, None)
+        self._free_slot(context)
+
+    def _queue(self, config: Config) -> asyncio.Queue[BrowserContext]:
+        key = config.resolved_profile_dir
+        queue = self._idle.get(key)
+        if queue is None:
+            queue = self._idle[key] = asyncio.Queue()
+        return queue
+
+    async def _launch(self, config: Config) -> BrowserContext:
+        state_path = config.storage_state_path
+        if config.use_shared_browser and state_path.exists():
+            browser = await self._get_browser(config)
+            context = await browser.new_context(
+                storage_state=str(state_path),
+                viewport={"width": 1920, "height": 1080},
+            )
+        else:
+            pw = await self._get_playwright()
+            context = await pw.chromium.launch_persistent_context(
+                user_data_dir=str(config.resolved_profile_dir),
+                channel="chrome",
+                headless=False,
+                args=config.batch_browser_args,
+                viewport={"width": 1920, "height": 1080},
+                no_viewport=False,
+            )
+        self._uses[context] = 0
+        # Forget contexts the user (or a crash) closes
+        context.on("close", self._forget)
+        return context
+
+    async def _close_when_launched(
+        self, launch: asyncio.Future[BrowserContext], key: Path
+    ) -> None:
+        """Close a launch nobody is waiting for, then free its profile slot."""
+        try:
+            context = await launch
+            self._uses.pop(context, None)
+            await _close_context(context)
+        except Exception:
+            pass
+        finally:
+            self._slot(key).release()
+
+    async def acquire(self, config: Config) -> BrowserContext:
+        """Return an idle context for ``config``'s profile, launching if needed.
+
+        Waits while the profile's context is checked out elsewhere.
+        """
+        key = config.resolved_profile_dir
+        await self._slot(key).acquire()
+        queue = self._queue(config)
+        while not queue.empty():
+            context = queue.get_nowait()
+            if context in self._uses:
+                self._checked_out[context] = key
+                return context
+        # Shielded so cancelling the caller (e.g. a startup timeout) cannot
+        # strand a half-started Chrome; the launch is closed once it's up.
+        launch = asyncio.ensure_future(self._launch(config))
+        try:
+            context = await asyncio.shield(launch)
+        except asyncio.CancelledError:
+            cleanup = asyncio.create_task(self._close_when_launched(launch, key))
+            self._cleanups.add(cleanup)
+            cleanup.add_done_callback(self._cleanups.discard)
+            raise
+        except BaseException:
+            self._slot(key).release()
+            raise
+        self._checked_out[context] = key
+        return context
+
+    async def release(
+        self, context: BrowserContext, config: Config, discard: bool = False
+    ) -> None:
+        """Return ``context`` to the pool, or close it.
+
+        The context is closed instead when ``discard`` is set (e.g. after a
+        worker crash) or it has reached ``recycle_after`` uses. Releasing a
+        context that is not checked out does nothing.
+        """
+        key = self._checked_out.pop(context, None)
+        if key is None:
+            return
+        try:
+            if context not in self._uses:
+                return
+            if config.use_shared_browser and not discard:
+                try:
+                    await context.storage_state(path=str(config.storage_state_path))
+                except Exception:
+                    pass
+            uses = self._uses[context] + 1
+            if discard or uses >= self.recycle_after:
+                self._uses.pop(context, None)
+                await _close_context(context)
+                return
+            self._uses[context] = uses
+            self._queue(config).put_nowait(context)
+        finally:
+            self._slot(key).release()
+
+    async def close(self) -> None:
+        """Close every pooled context and stop Playwright."""
+        if self._cleanups:
+            await asyncio.gather(*self._cleanups, return_exceptions=True)
+        for context in list(self._checked_out):
+            self._free_slot(context)
+        contexts = list(self._uses)
+        self._uses.clear()
+        self._idle.clear()
+        for context in contexts:
+            await _close_context(context)
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
@@ -1,8 +1,49 @@
 """Configuration for Gemini automation."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
+# Stored inside the Chrome profile dir so it is deleted with the profile
+STORAGE_STATE_FILE = "storage_state.json"
+
+
+def storage_state_path(profile_dir: Path) -> Path:
+    """Where the cookie/localStorage snapshot of ``profile_dir`` is kept.
+
+    Gemini and Flow configs for the same profile share this one file.
+    """
+    return profile_dir / STORAGE_STATE_FILE
+
+
+# Chrome subsystems automated batch runs don't need; each one skipped is a
+# process/thread less to start per browser.
+LIGHTWEIGHT_BROWSER_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-hang-monitor",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+)
+
+
+@lru_cache(maxsize=256)
+def resolve_profile_dir(profile_dir: Path) -> Path:
+    """``profile_dir.resolve()``, cached across Config instances.
+
+    ``profile_dir`` must already be absolute so the cache is not tied to
+    the working directory. Call ``resolve_profile_dir.cache_clear()`` when
+    profiles are removed.
+    """
+    return profile_dir.resolve()
+
 
 @dataclass
 class Config:
@@ -15,9 +56,17 @@ class Config:
     min_delay: float = 5.0
     max_delay: float = 10.0
     generation_timeout: float = 120_000  # ms
+    max_parallel_downloads: int = 8
+    parallel_tabs: int = 1  # chat tabs a batch is sharded across
+    # Run accounts as contexts of one shared Chrome (seeded from each
+    # profile's storage_state.json) instead of one Chrome process each
+    use_shared_browser: bool = False
+    # Add LIGHTWEIGHT_BROWSER_ARGS when launching batch browsers
+    lightweight_browser: bool = True
     selectors: dict = field(
         default_factory=lambda: {
             "textarea": "div.ql-editor.textarea",
+            "new_chat_button": 'button[aria-label="New chat"], button[aria-label="새 채팅"]',
             "send_button": 'button[aria-label="Send message"]',
             "generated_image": 'img[src*="googleusercontent.com"]',
             # Multi-language: EN + KR
@@ -37,6 +86,11 @@ class Config:
             "--no-default-browser-check",
         ]
     )
+    # Memoized filesystem state, keyed by the paths it was computed for so
+    # reassigning profile_dir/output_dir invalidates it.
+    _dirs_ready: tuple[Path, Path] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_defaults(cls, base_dir: Path | None = None) -> "Config":
@@ -57,7 +111,36 @@ class Config:
             account_name=account_name,
         )
 
+    @property
+    def resolved_profile_dir(self) -> Path:
+        """Absolute profile_dir, resolved once per distinct profile_dir."""
+        return resolve_profile_dir(self.profile_dir.absolute())
+
+    @property
+    def batch_browser_args(self) -> list[str]:
+        """browser_args plus, if enabled, the lightweight startup flags."""
+        if not self.lightweight_browser:
+            return self.browser_args
+        extra = [a for a in LIGHTWEIGHT_BROWSER_ARGS if a not in self.browser_args]
+        return [*self.browser_args, *extra]
+
+    @property
+    def storage_state_path(self) -> Path:
+        """Cookie/localStorage snapshot used by shared-browser contexts."""
+        return storage_state_path(self.profile_dir)
+
     def ensure_dirs(self) -> None:
         """Create profile and output directories if they don't exist."""
+        dirs = (self.profile_dir, self.output_dir)
+        if self._dirs_ready == dirs:
+            return
         self.profile_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._dirs_ready = dirs
+
+    def invalidate_dirs(self) -> None:
+        """Make the next ensure_dirs() recreate the directories.
+
+        Call after deleting profile_dir or output_dir from disk.
+        """
+        self._dirs_ready = None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,13 +13,21 @@ from gemini_automation.config import Config
 from gemini_automation.generator import GenerationResult
 from gemini_automation.metadata import embed_png_metadata
 
+try:
+    import aiohttp
+except ImportError:  # optional speedup; downloads go through Playwright otherwise
+    aiohttp = None
+
+_NON_WORD = re.compile(r"[^\w\-]", re.UNICODE)
+_MULTI_UNDERSCORE = re.compile(r"_+")
+
 
 def sanitize_filename(text: str, max_length: int = 50) -> str:
     """Sanitize text for use as a filename."""
     # Replace non-alphanumeric (keeping unicode letters) with underscore
-    sanitized = re.sub(r"[^\w\-]", "_", text, flags=re.UNICODE)
+    sanitized = _NON_WORD.sub("_", text)
     # Collapse multiple underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _MULTI_UNDERSCORE.sub("_", sanitized)
     # Strip leading/trailing underscores
     sanitized = sanitized.strip("_")
     # Truncate
@@ -27,6 +36,11 @@ def sanitize_filename(text: str, max_length: int = 50) -> str:
     return sanitized or "image"
 
 
+def _write_png(filepath: Path, body: bytes, prompt: str) -> None:
+    """Embed the prompt into ``body`` and write it to ``filepath``."""
+    filepath.write_bytes(embed_png_metadata(body, prompt))
+
+
 @dataclass
 class DownloadResult:
     """Result of downloading images for a single prompt."""
@@ -42,28 +56,74 @@ class ImageDownloader:
     def __init__(self, page: Page, config: Config) -> None:
         self.page = page
         self.config = config
+        # Caps in-flight requests when many downloads are gathered at once
+        self._semaphore = asyncio.Semaphore(config.max_parallel_downloads or 8)
+        # Direct HTTP session (aiohttp installed), created on first download
+        self._session: aiohttp.ClientSession | None = None
+
+    async def close(self) -> None:
+        """Close the direct HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _fetch_direct(self, url: str) -> bytes | None:
+        """Fetch ``url`` with aiohttp, bypassing the Playwright driver.
+
+        The request carries the browser's cookies for ``url``. Returns None
+        when aiohttp is unavailable or the fetch fails, so the caller can
+        fall back to the browser's request context. An empty 200 response
+        returns ``b""``; fetching it again would not help.
+        """
+        if aiohttp is None:
+            return None
+        try:
+            if self._session is None:
+                limit = self.config.max_parallel_downloads or 8
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=limit)
+                )
+            cookies = await self.page.context.cookies(url)
+            headers = {
+                "Cookie": "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+            }
+            async with self._session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    return None
+                if response.headers.get("Content-Length") == "0":
+                    return b""
+                return await response.read()
+        except Exception:
+            return None
 
     async def download(self, url: str, prompt: str, index: int) -> Path | None:
         """Download a single image and save to output directory."""
+        async with self._semaphore:
+            return await self._download(url, prompt, index)
+
+    async def _download(self, url: str, prompt: str, index: int) -> Path | None:
+        """Fetch one image and write it to disk. Returns None on failure."""
         try:
             sanitized = sanitize_filename(prompt)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{sanitized}_{index}_{timestamp}.png"
             filepath = self.config.output_dir / filename
 
-            response = await self.page.request.get(url)
-            if not response.ok:
-                print(
-                    f"  Warning: Download failed (HTTP {response.status}) for {url[:80]}"
-                )
-                return None
-
-            body = await response.body()
+            body = await self._fetch_direct(url)
+            if body is None:
+                response = await self.page.request.get(url)
+                if not response.ok:
+                    print(
+                        f"  Warning: Download failed (HTTP {response.status}) for {url[:80]}"
+                    )
+                    return None
+                body = await response.body()
             if not body:
                 print(f"  Warning: Empty response for {url[:80]}")
                 return None
 
-            filepath.write_bytes(embed_png_metadata(body, prompt))
+            # Off the event loop so other in-flight downloads keep progressing
+            await asyncio.to_thread(_write_png, filepath, body, prompt)
             return filepath
 
         except Exception as e:
@@ -71,12 +131,18 @@ class ImageDownloader:
             return None
 
     async def download_all(self, result: GenerationResult) -> DownloadResult:
-        """Download all images from a generation result."""
+        """Download all images from a generation result concurrently."""
         download_result = DownloadResult(prompt=result.prompt)
 
-        for i, url in enumerate(result.image_urls):
-            path = await self.download(url, result.prompt, i)
-            if path:
+        paths = await asyncio.gather(
+            *(
+                self.download(url, result.prompt, i)
+                for i, url in enumerate(result.image_urls)
+            ),
+            return_exceptions=True,
+        )
+        for url, path in zip(result.image_urls, paths):
+            if isinstance(path, Path):
                 download_result.saved_files.append(path)
             else:
                 download_result.failed_urls.append(url)
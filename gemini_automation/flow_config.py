@@ -6,6 +6,13 @@ import json
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from gemini_automation.config import storage_state_path
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 
 def _load_tier_accounts(base_dir: Path | None = None) -> dict[str, str]:
     """Load tier→account mapping from accounts.json.
@@ -18,7 +25,8 @@ def _load_tier_accounts(base_dir: Path | None = None) -> dict[str, str]:
     if not accounts_file.exists():
         return {}
     try:
-        data = json.loads(accounts_file.read_text(encoding="utf-8"))
+        raw = accounts_file.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         mapping: dict[str, str] = {}
         for acct in data.get("accounts", []):
             tier = acct.get("tier")
@@ -29,8 +37,30 @@ def _load_tier_accounts(base_dir: Path | None = None) -> dict[str, str]:
         return {}
 
 
-# Lazy-loaded tier mapping (populated on first use)
-TIER_ACCOUNTS: dict[str, str] = _load_tier_accounts()
+# Lazy-loaded tier mapping: (accounts.json path, mtime, mapping)
+_tier_accounts_cache: tuple[Path, float, dict[str, str]] | None = None
+
+
+def get_tier_accounts() -> dict[str, str]:
+    """Return the tier→account mapping, reloading only when accounts.json changes."""
+    global _tier_accounts_cache
+    accounts_file = Path.cwd() / "accounts.json"
+    try:
+        mtime = accounts_file.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    cached = _tier_accounts_cache
+    if cached is None or cached[0] != accounts_file or cached[1] != mtime:
+        cached = (accounts_file, mtime, _load_tier_accounts())
+        _tier_accounts_cache = cached
+    return cached[2]
+
+
+def __getattr__(name: str):
+    # Backwards compatibility: TIER_ACCOUNTS used to be an import-time global.
+    if name == "TIER_ACCOUNTS":
+        return get_tier_accounts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -47,6 +77,7 @@ class FlowConfig:
     min_delay: float = 3.0
     max_delay: float = 7.0
     generation_timeout: float = 120_000  # ms
+    max_parallel_downloads: int = 8
     selectors: dict = field(
         default_factory=lambda: {
             # Navigation & mode (EN + KR)
@@ -89,7 +120,7 @@ class FlowConfig:
         cls, tier: str, base_dir: Path | None = None, project_name: str | None = None
     ) -> "FlowConfig":
         """Create config for a specific tier (ultra/pro)."""
-        account_name = TIER_ACCOUNTS.get(tier)
+        account_name = get_tier_accounts().get(tier)
         if not account_name:
             raise ValueError(f"Unknown tier '{tier}'. Use 'ultra' or 'pro'.")
         base = base_dir or Path.cwd()
@@ -108,7 +139,7 @@ class FlowConfig:
         """Create config with profile_dir pointing to account-specific Chrome profile."""
         base = base_dir or Path.cwd()
         tier = None
-        for t, name in TIER_ACCOUNTS.items():
+        for t, name in get_tier_accounts().items():
             if name == account_name:
                 tier = t
                 break
@@ -129,6 +160,14 @@ class FlowConfig:
             output_dir=base / "output" / "flow",
         )
 
+    @property
+    def storage_state_path(self) -> Path:
+        """Playwright storage_state snapshot, refreshed after project setup.
+
+        Shared-browser contexts (see BrowserPool) start logged in from it.
+        """
+        return storage_state_path(self.profile_dir)
+
     def ensure_dirs(self) -> None:
         """Create profile and output directories if they don't exist."""
         self.profile_dir.mkdir(parents=True, exist_ok=True)
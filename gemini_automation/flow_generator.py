@@ -26,12 +26,199 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from playwright.async_api import Page
+from playwright.async_api import (
+    Locator,
+    Page,
+    TimeoutError as PlaywrightTimeoutError,
+    expect,
+)
 
 from gemini_automation.flow_config import FlowConfig
 from gemini_automation.metadata import embed_png_metadata
 from gemini_automation.overlay import BrowserOverlay
 
+# Snapshot of generated <img> elements: src plus natural size, optionally
+# limited to rendered (non-hidden, non-zero-size) elements.
+_GENERATED_IMAGES_JS = """([selector, visibleOnly]) => {
+    const out = [];
+    for (const el of document.querySelectorAll(selector)) {
+        if (visibleOnly) {
+            const rect = el.getBoundingClientRect();
+            if (rect.width === 0 || rect.height === 0) continue;
+            if (getComputedStyle(el).visibility === 'hidden') continue;
+        }
+        out.push({
+            src: el.getAttribute('src') || '',
+            w: el.naturalWidth,
+            h: el.naturalHeight,
+        });
+    }
+    return out;
+}"""
+
+# Href of the dashboard card whose title span reads exactly ``name``.
+_FIND_PROJECT_HREF_JS = """(name) => {
+    const spans = document.querySelectorAll('span');
+    for (const span of spans) {
+        // Get only the direct text of this span (exclude nested button text
+        // like "editEdit project" which is inside the same span)
+        const firstTextNode = Array.from(span.childNodes).find(n => n.nodeType === 3);
+        const spanText = firstTextNode ? firstTextNode.textContent.trim() : '';
+        if (spanText === name) {
+            // Walk up to card container to find the sibling <a> link
+            let container = span.parentElement;
+            for (let i = 0; i < 5 && container; i++) {
+                const link = container.querySelector('a[href*="/project/"]');
+                if (link) return link.getAttribute('href');
+                container = container.parentElement;
+            }
+        }
+    }
+    return null;
+}"""
+
+# True once a small reference thumbnail (data: or GCS background image) is
+# rendered in the prompt box: the subtree a few levels above the textarea.
+# Inline-style backgrounds are matched by attribute selector first; only
+# then are the remaining candidates checked with getComputedStyle.
+_THUMBNAIL_READY_JS = """(textareaSelector) => {
+    let root = document.querySelector(textareaSelector);
+    for (let i = 0; i < 6 && root && root.parentElement; i++) {
+        root = root.parentElement;
+    }
+    root = root || document.body;
+    const sized = (el) => {
+        if (el.offsetParent === null && el.offsetWidth === 0) return false;
+        if (el.offsetWidth > 100 || el.offsetHeight > 100) return false;
+        return el.offsetWidth >= 20;
+    };
+    const inline = root.querySelectorAll(
+        '[style*="data:image/"], [style*="storage.googleapis.com"]'
+    );
+    for (const el of inline) {
+        if (sized(el)) return true;
+    }
+    for (const el of root.querySelectorAll('button, div')) {
+        if (!sized(el)) continue;
+        const bg = getComputedStyle(el).backgroundImage;
+        if (bg && bg !== 'none' &&
+            (bg.startsWith('url("data:image/') ||
+             bg.includes('storage.googleapis.com'))) {
+            return true;
+        }
+    }
+    return false;
+}"""
+
+# Click tile index 1 in the ingredient picker menu (the uploaded reference).
+_CLICK_REFERENCE_TILE_JS = """() => {
+    const menu = document.querySelector('[role="menu"]');
+    if (!menu) return { clicked: false, error: 'No menu found' };
+
+    const btns = menu.querySelectorAll('button');
+    let tileIndex = 0;
+
+    for (const btn of btns) {
+        const rect = btn.getBoundingClientRect();
+        // Filter to only large tiles (100-200px)
+        if (rect.width < 100 || rect.width > 200) continue;
+        if (rect.height < 100 || rect.height > 200) continue;
+
+        // Skip index 0 (Upload button), click index 1 (uploaded reference)
+        if (tileIndex === 1) {
+            btn.click();
+            return { clicked: true, tileIndex: 1 };
+        }
+        tileIndex++;
+    }
+    return { clicked: false, error: 'Index 1 tile not found' };
+}"""
+
+# Index among all <input>s of the first visible one that is not a search box,
+# or -1.
+_PROJECT_NAME_INPUT_INDEX_JS = """() => {
+    const inputs = document.querySelectorAll('input');
+    for (let i = 0; i < inputs.length; i++) {
+        const el = inputs[i];
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) continue;
+        if (getComputedStyle(el).visibility === 'hidden') continue;
+        // Skip search inputs
+        const placeholder = (el.getAttribute('placeholder') || '').toLowerCase();
+        if (placeholder.includes('search') || placeholder.includes('검색')) continue;
+        return i;
+    }
+    return -1;
+}"""
+
+# True once ``n`` rendered, full-size images whose base URL is not in
+# ``existing`` are on the page.
+_NEW_IMAGES_READY_JS = """([selector, existing, n]) => {
+    const seen = new Set(existing);
+    const fresh = new Set();
+    for (const el of document.querySelectorAll(selector)) {
+        const src = el.getAttribute('src') || '';
+        if (!src || seen.has(src.split('?')[0]) || fresh.has(src)) continue;
+        if (el.naturalWidth < 256 || el.naturalHeight < 256) continue;
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) continue;
+        fresh.add(src);
+        if (fresh.size >= n) return true;
+    }
+    return false;
+}"""
+
+# True once the number of matching images has not changed for ``quietMs``.
+# State lives on ``window`` keyed by ``token`` so each wait starts fresh.
+_IMAGE_COUNT_SETTLED_JS = """([selector, quietMs, token]) => {
+    const n = document.querySelectorAll(selector).length;
+    const now = performance.now();
+    const st = window.__gemflowSettle;
+    if (!st || st.token !== token || st.n !== n) {
+        window.__gemflowSettle = {token, n, since: now};
+        return false;
+    }
+    return now - st.since >= quietMs;
+}"""
+
+# Flow fetches finished images from this path (the same one the
+# generated_image selector matches); the responses arrive shortly before the
+# <img> elements are painted.
+_IMAGE_RESPONSE_PATH = "storage.googleapis.com/ai-sandbox-videofx/image/"
+
+# Common rejection phrases in EN and KR
+_REJECTION_PHRASES = (
+    "can't generate",
+    "unable to generate",
+    "content policy",
+    "policy violation",
+    "copyright",
+    "not allowed",
+    "couldn't create",
+    "violates",
+    "harmful content",
+    "unsafe content",
+    "생성할 수 없",
+    "정책 위반",
+    "저작권",
+    "허용되지 않",
+    "유해한 콘텐츠",
+)
+# Regex source for the in-page scan (re.escape output is valid in JS regexes)
+_REJECTION_PATTERN = "|".join(re.escape(p) for p in _REJECTION_PHRASES)
+
+# Case-insensitive search of the first 5000 chars of page text; returns the
+# matched phrase and its surrounding line, or null.
+_REJECTION_SCAN_JS = """(pattern) => {
+    const text = document.body.innerText.substring(0, 5000);
+    const m = new RegExp(pattern, 'i').exec(text);
+    if (!m) return null;
+    const start = text.lastIndexOf('\\n', m.index) + 1;
+    let end = text.indexOf('\\n', m.index);
+    if (end === -1) end = text.length;
+    return {phrase: m[0], line: text.slice(start, end).trim().slice(0, 200)};
+}"""
+
 
 @dataclass
 class FlowGenerationResult:
@@ -53,24 +240,59 @@ class FlowImageGenerator:
         self.config = config
         self.overlay = overlay
         self._project_initialized = False
+        self._consent_done = False
+        self._reference_resolved: Path | None = None
+        self._reference_uploaded = False
+        # Set once the generated-image responses since the last Create
+        # click have loaded; a hint to poll the DOM faster, not a result.
+        self._response_listener = None
+        self._responses_done = asyncio.Event()
+        # Locators are lazy (resolved on each action), so one per selector key
+        # stays valid across navigations.
+        self._loc: dict[str, Locator] = {
+            key: page.locator(sel) for key, sel in config.selectors.items()
+        }
+        self._option_locs: dict[int, Locator] = {}
+
+    def _option_locator(self, count: int) -> Locator:
+        """Return the (memoized) dropdown option locator for ``count``."""
+        loc = self._option_locs.get(count)
+        if loc is None:
+            loc = self.page.locator(f"[role='option']:has-text('{count}')").first
+            self._option_locs[count] = loc
+        return loc
 
     async def _dismiss_consent_and_promos(self) -> None:
-        """Handle cookie consent and promotional banners."""
-        # Cookie consent
+        """Handle cookie consent and promotional banners.
+
+        Cookie consent only needs accepting once per session; after that
+        only the promo banner is checked. When nothing is showing this
+        costs a single visibility check.
+        """
+        agree = self._loc["cookie_agree"].first
+        close_btn = self._loc["promo_close"].first
+        banner = close_btn if self._consent_done else agree.or_(close_btn).first
         try:
-            agree = self.page.locator(self.config.selectors["cookie_agree"])
-            if await agree.count() > 0 and await agree.first.is_visible():
-                await agree.first.click()
-                await asyncio.sleep(2)
+            if not await banner.is_visible():
+                return
         except Exception:
-            pass
+            return
+
+        # Cookie consent
+        if not self._consent_done:
+            try:
+                if await agree.is_visible():
+                    await agree.click()
+                    await agree.wait_for(state="hidden", timeout=3_000)
+                    self._consent_done = True
+            except Exception:
+                pass
 
         # Promo close button
         try:
-            close_btn = self.page.locator(self.config.selectors["promo_close"]).first
-            if await close_btn.count() > 0 and await close_btn.is_visible():
+            if await close_btn.is_visible():
                 await close_btn.click()
-                await asyncio.sleep(1)
+                await close_btn.wait_for(state="hidden", timeout=2_000)
         except Exception:
             pass
 
@@ -82,19 +304,27 @@ class FlowImageGenerator:
             )
         except Exception:
             pass
-        await asyncio.sleep(3)
+
+        # Wait until either the dashboard or the landing page has rendered
+        new_project = self._loc["new_project"].first
+        create_with_flow = self.page.locator("button:has-text('Create with Flow')")
+        try:
+            await new_project.or_(create_with_flow.first).first.wait_for(
+                state="visible", timeout=10_000
+            )
+        except Exception:
+            pass
 
         await self._dismiss_consent_and_promos()
 
         # If on landing page, click "Create with Flow" to enter dashboard
-        create_with_flow = self.page.locator("button:has-text('Create with Flow')")
         try:
             if (
                 await create_with_flow.count() > 0
                 and await create_with_flow.first.is_visible()
             ):
                 await create_with_flow.first.click()
-                await asyncio.sleep(5)
+                await new_project.wait_for(state="visible", timeout=15_000)
                 await self._dismiss_consent_and_promos()
         except Exception:
             pass
@@ -112,28 +342,7 @@ class FlowImageGenerator:
         Strategy: Find span with matching text → walk up to card container
         → find sibling <a> with project URL → click it.
         """
-        href = await self.page.evaluate(
-            """(name) => {
-            const spans = document.querySelectorAll('span');
-            for (const span of spans) {
-                // Get only the direct text of this span (exclude nested button text
-                // like "editEdit project" which is inside the same span)
-                const firstTextNode = Array.from(span.childNodes).find(n => n.nodeType === 3);
-                const spanText = firstTextNode ? firstTextNode.textContent.trim() : '';
-                if (spanText === name) {
-                    // Walk up to card container to find the sibling <a> link
-                    let container = span.parentElement;
-                    for (let i = 0; i < 5 && container; i++) {
-                        const link = container.querySelector('a[href*="/project/"]');
-                        if (link) return link.getAttribute('href');
-                        container = container.parentElement;
-                    }
-                }
-            }
-            return null;
-        }""",
-            name,
-        )
+        href = await self.page.evaluate(_FIND_PROJECT_HREF_JS, name)
 
         if href:
             # Navigate directly to the project URL
@@ -141,14 +350,19 @@ class FlowImageGenerator:
             await self.page.goto(
                 full_url, wait_until="domcontentloaded", timeout=30_000
             )
-            await asyncio.sleep(5)
+            try:
+                await self._loc["images_tab"].first.wait_for(
+                    state="visible", timeout=15_000
+                )
+            except Exception:
+                pass
             if "/project/" in self.page.url:
                 return True
         return False
 
     async def _rename_project(self, name: str) -> str | None:
         """Rename the current project. Returns error or None."""
-        edit_btn = self.page.locator(self.config.selectors["edit_project"])
+        edit_btn = self._loc["edit_project"]
         try:
             await edit_btn.first.wait_for(state="visible", timeout=5_000)
             await edit_btn.first.click()
@@ -157,23 +371,15 @@ class FlowImageGenerator:
             return "Edit project button not found"
 
         # Find the project name input (first visible input that's not search/textarea)
-        inputs = await self.page.locator("input").all()
-        name_input = None
-        for inp in inputs:
-            try:
-                if await inp.is_visible():
-                    placeholder = await inp.get_attribute("placeholder") or ""
-                    # Skip search inputs
-                    if "search" in placeholder.lower() or "검색" in placeholder.lower():
-                        continue
-                    name_input = inp
-                    break
-            except Exception:
-                continue
+        try:
+            idx = await self.page.evaluate(_PROJECT_NAME_INPUT_INDEX_JS)
+        except Exception:
+            idx = -1
+        name_input = self.page.locator("input").nth(idx) if idx >= 0 else None
 
         if not name_input:
             # Cancel edit
-            cancel = self.page.locator(self.config.selectors["cancel_edit"])
+            cancel = self._loc["cancel_edit"]
             try:
                 await cancel.first.click()
             except Exception:
@@ -186,7 +392,7 @@ class FlowImageGenerator:
         await asyncio.sleep(0.5)
 
         # Save
-        save_btn = self.page.locator(self.config.selectors["save_edit"])
+        save_btn = self._loc["save_edit"]
         try:
             await save_btn.first.wait_for(state="visible", timeout=3_000)
             await save_btn.first.click()
@@ -210,7 +416,7 @@ class FlowImageGenerator:
         # If project_name is set, try to find existing project
         if project_name:
             # Check dashboard for existing project
-            new_proj = self.page.locator(self.config.selectors["new_project"])
+            new_proj = self._loc["new_project"]
             try:
                 await new_proj.first.wait_for(state="visible", timeout=10_000)
             except Exception:
@@ -222,7 +428,10 @@ class FlowImageGenerator:
             else:
                 # Create new and rename
                 await new_proj.first.click()
-                await asyncio.sleep(5)
+                try:
+                    await self.page.wait_for_url("**/project/**", timeout=15_000)
+                except Exception:
+                    pass
                 if "/project/" not in self.page.url:
                     return f"Failed to create project. URL: {self.page.url}"
                 rename_error = await self._rename_project(project_name)
@@ -232,26 +441,32 @@ class FlowImageGenerator:
                     print(f"  Created new project: '{project_name}'")
         else:
             # No name — just create new project
-            new_proj = self.page.locator(self.config.selectors["new_project"])
+            new_proj = self._loc["new_project"]
             try:
                 await new_proj.first.wait_for(state="visible", timeout=10_000)
                 await new_proj.first.click()
-                await asyncio.sleep(5)
             except Exception:
                 return "Failed to find 'New project' button — may not be logged in"
+            try:
+                await self.page.wait_for_url("**/project/**", timeout=15_000)
+            except Exception:
+                pass
 
         # Verify we're in a project
         if "/project/" not in self.page.url:
             return f"Failed to enter project. URL: {self.page.url}"
 
         # Switch to Images mode
-        images_btn = self.page.locator(self.config.selectors["images_tab"])
+        images_btn = self._loc["images_tab"]
         try:
             await images_btn.first.wait_for(state="visible", timeout=10_000)
             await images_btn.first.click()
-            await asyncio.sleep(2)
         except Exception:
             return "Failed to switch to Images mode"
+        try:
+            await self._loc["textarea"].first.wait_for(state="visible", timeout=10_000)
+        except Exception:
+            pass
 
         # Set outputs per prompt (default: 4)
         count_error = await self._set_image_count(self.config.images_per_prompt)
@@ -259,6 +474,12 @@ class FlowImageGenerator:
             print(f"  Warning: {count_error}")
 
         self._project_initialized = True
+
+        # Persist cookies/localStorage so fresh contexts skip login and banners
+        try:
+            await self.page.context.storage_state(path=self.config.storage_state_path)
+        except Exception as e:
+            print(f"  Warning: Could not save auth state: {e}")
         return None
 
     async def _set_image_count(self, count: int) -> str | None:
@@ -267,7 +488,7 @@ class FlowImageGenerator:
         Returns None on success, or an error message string.
         """
         # Open settings panel
-        settings_btn = self.page.locator(self.config.selectors["settings_button"])
+        settings_btn = self._loc["settings_button"]
         try:
             await settings_btn.wait_for(state="visible", timeout=5_000)
             await settings_btn.click()
@@ -276,7 +497,7 @@ class FlowImageGenerator:
             return "Settings button not found"
 
         # Click "Outputs per prompt" dropdown
-        outputs_btn = self.page.locator(self.config.selectors["outputs_per_prompt"])
+        outputs_btn = self._loc["outputs_per_prompt"]
         try:
             await outputs_btn.wait_for(state="visible", timeout=5_000)
             await outputs_btn.click()
@@ -287,7 +508,7 @@ class FlowImageGenerator:
             return "Outputs per prompt dropdown not found"
 
         # Select the desired count from dropdown options
-        option = self.page.locator(f"[role='option']:has-text('{count}')").first
+        option = self._option_locator(count)
         try:
             await option.wait_for(state="visible", timeout=3_000)
             await option.click()
@@ -301,7 +522,7 @@ class FlowImageGenerator:
         await asyncio.sleep(0.5)
         return None
 
-    async def _upload_reference_image(self, image_path: str) -> str | None:
+    async def _upload_reference_image(self, image_path: str | Path) -> str | None:
         """Upload a reference image via the add button near the textarea.
 
         Flow:
@@ -317,21 +538,24 @@ class FlowImageGenerator:
 
         Returns error message or None on success.
         """
-        resolved = Path(image_path).resolve()
-        if not resolved.exists():
-            return f"Reference image not found: {resolved}"
+        resolved = Path(image_path)
+        # generate_batch() validates the path once up front; only re-check
+        # paths that did not come from there.
+        if resolved != self._reference_resolved:
+            resolved = resolved.resolve()
+            if not resolved.exists():
+                return f"Reference image not found: {resolved}"
 
         # Click the add button (last one matching, near textarea)
-        add_btn = self.page.locator(self.config.selectors["add_reference_button"]).last
+        add_btn = self._loc["add_reference_button"].last
         try:
             await add_btn.wait_for(state="visible", timeout=5_000)
             await add_btn.click()
-            await asyncio.sleep(2)
         except Exception:
             return "Add reference button not found"
 
-        # Set file on the hidden input
-        file_input = self.page.locator(self.config.selectors["reference_file_input"])
+        # Set file on the hidden input (set_input_files waits for it to attach)
+        file_input = self._loc["reference_file_input"]
         try:
             await file_input.set_input_files(str(resolved))
             # Don't use fixed sleep - wait for crop modal instead
@@ -341,7 +565,7 @@ class FlowImageGenerator:
 
         # Wait for "Crop and Save" button (indicates upload complete + crop modal visible)
         # Use longer timeout (30s) to handle large files
-        crop_save = self.page.locator(self.config.selectors["crop_and_save"])
+        crop_save = self._loc["crop_and_save"]
         try:
             await crop_save.first.wait_for(state="visible", timeout=30_000)
             await crop_save.first.click()
@@ -355,45 +579,25 @@ class FlowImageGenerator:
             )
 
         # Wait for the crop modal to close
-        for _ in range(15):
-            await asyncio.sleep(1)
-            still_open = False
-            try:
-                still_open = (
-                    await crop_save.first.is_visible()
-                    if await crop_save.count() > 0
-                    else False
-                )
-            except Exception:
-                pass
-            if not still_open:
-                break
+        try:
+            await expect(crop_save.first).to_be_hidden(timeout=15_000)
+        except AssertionError:
+            pass
 
-        # Poll for reference thumbnail to appear near textarea
+        # Wait for reference thumbnail to appear near textarea
         thumbnail_ready = False
-        for _ in range(15):
-            await asyncio.sleep(1)
-            try:
-                thumbnail_ready = await self.page.evaluate("""() => {
-                    const els = document.querySelectorAll('button, div');
-                    for (const el of els) {
-                        if (el.offsetParent === null && el.offsetWidth === 0) continue;
-                        if (el.offsetWidth > 100 || el.offsetHeight > 100) continue;
-                        if (el.offsetWidth < 20) continue;
-                        const bg = getComputedStyle(el).backgroundImage;
-                        if (bg && bg !== 'none' &&
-                            (bg.startsWith('url("data:image/') ||
-                             bg.includes('storage.googleapis.com'))) {
-                            return true;
-                        }
-                    }
-                    return false;
-                }""")
-                if thumbnail_ready:
-                    break
-            except Exception:
-                pass
+        try:
+            await self.page.wait_for_function(
+                _THUMBNAIL_READY_JS,
+                arg=self.config.selectors["textarea"],
+                polling=200,
+                timeout=15_000,
+            )
+            thumbnail_ready = True
+        except Exception:
+            pass
 
+        self._reference_uploaded = True
         if thumbnail_ready:
             print(f"  Uploaded reference image: {resolved.name}")
         else:
@@ -441,7 +645,7 @@ class FlowImageGenerator:
         Returns error message or None on success.
         """
         # Open the ingredient picker
-        add_btn = self.page.locator(self.config.selectors["add_reference_button"]).last
+        add_btn = self._loc["add_reference_button"].last
         try:
             await add_btn.wait_for(state="visible", timeout=5_000)
             await add_btn.click()
@@ -451,28 +655,7 @@ class FlowImageGenerator:
 
         # Click the tile at index 1 (right after Upload button)
         # This is where the uploaded reference image always appears
-        clicked = await self.page.evaluate("""() => {
-            const menu = document.querySelector('[role="menu"]');
-            if (!menu) return { clicked: false, error: 'No menu found' };
-
-            const btns = menu.querySelectorAll('button');
-            let tileIndex = 0;
-
-            for (const btn of btns) {
-                const rect = btn.getBoundingClientRect();
-                // Filter to only large tiles (100-200px)
-                if (rect.width < 100 || rect.width > 200) continue;
-                if (rect.height < 100 || rect.height > 200) continue;
-
-                // Skip index 0 (Upload button), click index 1 (uploaded reference)
-                if (tileIndex === 1) {
-                    btn.click();
-                    return { clicked: true, tileIndex: 1 };
-                }
-                tileIndex++;
-            }
-            return { clicked: false, error: 'Index 1 tile not found' };
-        }""")
+        clicked = await self.page.evaluate(_CLICK_REFERENCE_TILE_JS)
 
         if not clicked.get("clicked"):
             await self.page.keyboard.press("Escape")
@@ -481,25 +664,16 @@ class FlowImageGenerator:
 
         # Wait for the picker to close and the thumbnail to appear
         thumbnail_ready = False
-        for _ in range(10):
-            await asyncio.sleep(1)
-            thumbnail_ready = await self.page.evaluate("""() => {
-                const els = document.querySelectorAll('button, div');
-                for (const el of els) {
-                    if (el.offsetParent === null && el.offsetWidth === 0) continue;
-                    if (el.offsetWidth > 100 || el.offsetHeight > 100) continue;
-                    if (el.offsetWidth < 20) continue;
-                    const bg = getComputedStyle(el).backgroundImage;
-                    if (bg && bg !== 'none' &&
-                        (bg.startsWith('url("data:image/') ||
-                         bg.includes('storage.googleapis.com'))) {
-                        return true;
-                    }
-                }
-                return false;
-            }""")
-            if thumbnail_ready:
-                break
+        try:
+            await self.page.wait_for_function(
+                _THUMBNAIL_READY_JS,
+                arg=self.config.selectors["textarea"],
+                polling=200,
+                timeout=10_000,
+            )
+            thumbnail_ready = True
+        except Exception:
+            pass
 
         if not thumbnail_ready:
             print("  Warning: Reference thumbnail did not appear after re-attach")
@@ -513,40 +687,42 @@ class FlowImageGenerator:
 
         Returns an error message if rejection detected, None otherwise.
         """
-        # Common rejection phrases in EN and KR
-        rejection_phrases = [
-            "can't generate",
-            "unable to generate",
-            "content policy",
-            "policy violation",
-            "copyright",
-            "not allowed",
-            "couldn't create",
-            "violates",
-            "harmful content",
-            "unsafe content",
-            "생성할 수 없",
-            "정책 위반",
-            "저작권",
-            "허용되지 않",
-            "유해한 콘텐츠",
-        ]
         try:
-            # Check for error/warning banners or text on the page
-            body_text = await self.page.evaluate(
-                "() => document.body.innerText.substring(0, 5000)"
-            )
-            body_lower = body_text.lower()
-            for phrase in rejection_phrases:
-                if phrase.lower() in body_lower:
-                    # Extract the relevant line for context
-                    for line in body_text.split("\n"):
-                        if phrase.lower() in line.lower():
-                            return f"Content policy rejection: {line.strip()[:200]}"
-                    return f"Content policy rejection (matched: '{phrase}')"
+            # Match inside the page so only the offending line crosses the bridge
+            hit = await self.page.evaluate(_REJECTION_SCAN_JS, _REJECTION_PATTERN)
         except Exception:
-            pass
-        return None
+            return None
+        if not hit:
+            return None
+        if hit["line"]:
+            return f"Content policy rejection: {hit['line']}"
+        return f"Content policy rejection (matched: '{hit['phrase']}')"
+
+    async def _snapshot_images(self, visible_only: bool = True) -> list[dict]:
+        """Return ``{src, w, h}`` for every generated image in one round-trip."""
+        return await self.page.evaluate(
+            _GENERATED_IMAGES_JS,
+            [self.config.selectors["generated_image"], visible_only],
+        )
+
+    async def _collect_new_images(
+        self, existing_urls: set[str], new_image_urls: list[str]
+    ) -> None:
+        """Append rendered, full-size images not in ``existing_urls``."""
+        # One set of base URLs covers both pre-existing and already-collected
+        seen = existing_urls | {url.split("?")[0] for url in new_image_urls}
+        for img in await self._snapshot_images():
+            src = img["src"]
+            if not src:
+                continue
+            # Verify it's a real image (not a placeholder)
+            if img["w"] < 256 or img["h"] < 256:
+                continue
+            base_url = src.split("?")[0]
+            if base_url in seen:
+                continue
+            seen.add(base_url)
+            new_image_urls.append(src)
 
     def _is_page_alive(self) -> bool:
         """Check if the page/browser is still open."""
@@ -565,64 +741,141 @@ class FlowImageGenerator:
             reference_image: Optional path to a local image file to use as
                 style/content reference.
         """
+        return await self._generate(prompt, reference_image)
+
+    async def _generate(
+        self,
+        prompt: str,
+        reference_image: str | Path | None = None,
+        next_prompt: str | None = None,
+    ) -> FlowGenerationResult:
+        """Submit ``prompt`` and wait for its images.
+
+        If ``next_prompt`` is given, it is typed into the (now empty) prompt
+        box while the current images render, so the next submit only has to
+        click Create.
+        """
         try:
-            if self.overlay:
-                await self.overlay.update(
-                    status="Initializing project...",
-                    skip_enabled=True,
-                    next_enabled=False,
-                )
+            submitted = await self._submit(prompt, reference_image)
+            if isinstance(submitted, FlowGenerationResult):
+                return submitted
+            if next_prompt is None:
+                return await self._await_results(prompt, submitted)
+            result, _ = await asyncio.gather(
+                self._await_results(prompt, submitted),
+                self._prefill(next_prompt),
+            )
+            return result
+        except Exception as e:
+            return FlowGenerationResult(
+                prompt=prompt,
+                success=False,
+                error=str(e),
+            )
+        finally:
+            self._stop_watching_responses()
 
-            # Ensure we have a project and are in Images mode
-            init_error = await self._ensure_project()
-            if init_error:
-                return FlowGenerationResult(
-                    prompt=prompt, success=False, error=init_error
-                )
+    def _watch_image_responses(self, existing_urls: set[str]) -> None:
+        """Watch for new generated-image responses from Flow's storage path.
 
-            # Upload reference image if provided
-            if reference_image:
-                if self.overlay:
-                    await self.overlay.update(status="Uploading reference image...")
-                ref_error = await self._upload_reference_image(reference_image)
-                if ref_error:
-                    return FlowGenerationResult(
-                        prompt=prompt, success=False, error=ref_error
-                    )
+        Sets ``_responses_done`` once ``images_per_prompt`` images not in
+        ``existing_urls`` have loaded.
+        """
+        self._stop_watching_responses()
+        seen: set[str] = set()
+        done = asyncio.Event()
+        expected = self.config.images_per_prompt
+
+        def on_response(response) -> None:
+            url = response.url
+            if _IMAGE_RESPONSE_PATH not in url or not response.ok:
+                return
+            if not response.headers.get("content-type", "").startswith("image/"):
+                return
+            base_url = url.split("?")[0]
+            if base_url in existing_urls or base_url in seen:
+                return
+            seen.add(base_url)
+            if len(seen) >= expected:
+                done.set()
+
+        self.page.on("response", on_response)
+        self._response_listener = on_response
+        self._responses_done = done
+
+    def _stop_watching_responses(self) -> None:
+        """Detach the listener installed by _watch_image_responses()."""
+        if self._response_listener is not None:
+            self.page.remove_listener("response", self._response_listener)
+            self._response_listener = None
+
+    async def _prefill(self, prompt: str) -> None:
+        """Type the next prompt into the textarea ahead of its submit (best effort)."""
+        try:
+            textarea = self._loc["textarea"].first
+            await textarea.wait_for(state="visible", timeout=10_000)
+            await textarea.fill(prompt)
+        except Exception:
+            pass
 
-            # Collect existing image URLs to distinguish new ones
-            # Wait a moment to ensure all previous images have their final URLs
-            await asyncio.sleep(1)
-            existing_urls = set()
-            existing_imgs = await self.page.locator(
-                self.config.selectors["generated_image"]
-            ).all()
-            for img in existing_imgs:
-                try:
-                    src = await img.get_attribute("src") or ""
-                    if src:
-                        existing_urls.add(
-                            src.split("?")[0]
-                        )  # strip query params for comparison
-                except Exception:
-                    pass
+    async def _submit(
+        self, prompt: str, reference_image: str | Path | None = None
+    ) -> set[str] | FlowGenerationResult:
+        """Prepare the project, enter the prompt and click Create.
 
-            # Enter prompt
-            textarea = self.page.locator(self.config.selectors["textarea"]).first
-            try:
-                await textarea.wait_for(state="visible", timeout=10_000)
-            except Exception:
-                return FlowGenerationResult(
-                    prompt=prompt,
-                    success=False,
-                    error="Prompt textarea not found",
-                )
+        Returns the set of image base URLs that existed before submission,
+        or a failed FlowGenerationResult.
+        """
+        if self.overlay:
+            await self.overlay.update(
+                status="Initializing project...",
+                skip_enabled=True,
+                next_enabled=False,
+            )
+
+        # Ensure we have a project and are in Images mode
+        init_error = await self._ensure_project()
+        if init_error:
+            return FlowGenerationResult(prompt=prompt, success=False, error=init_error)
 
+        # Upload reference image if provided
+        if reference_image:
             if self.overlay:
-                await self.overlay.update(
-                    status=f"Sending: {prompt[:60]}{'…' if len(prompt) > 60 else ''}",
+                await self.overlay.update(status="Uploading reference image...")
+            ref_error = await self._upload_reference_image(reference_image)
+            if ref_error:
+                return FlowGenerationResult(
+                    prompt=prompt, success=False, error=ref_error
                 )
 
+        # Collect existing image URLs to distinguish new ones
+        # Wait a moment to ensure all previous images have their final URLs
+        await asyncio.sleep(1)
+        # (strip query params for comparison)
+        existing_urls = {
+            img["src"].split("?")[0]
+            for img in await self._snapshot_images(visible_only=False)
+            if img["src"]
+        }
+
+        # Enter prompt
+        textarea = self._loc["textarea"].first
+        try:
+            await textarea.wait_for(state="visible", timeout=10_000)
+        except Exception:
+            return FlowGenerationResult(
+                prompt=prompt,
+                success=False,
+                error="Prompt textarea not found",
+            )
+
+        if self.overlay:
+            await self.overlay.update(
+                status=f"Sending: {prompt[:60]}{'…' if len(prompt) > 60 else ''}",
+            )
+
+        # Skip retyping if the prompt was prefilled during the previous wait
+        if await textarea.input_value() != prompt:
             await textarea.click()
             # Clear existing text first
             await textarea.fill("")
@@ -630,130 +883,152 @@ class FlowImageGenerator:
             await textarea.fill(prompt)
             await asyncio.sleep(0.5)
 
-            # Click Create
-            create_btn = self.page.locator(self.config.selectors["create_button"]).first
-            try:
-                await create_btn.wait_for(state="visible", timeout=5_000)
-                await create_btn.click()
-            except Exception:
+        # Click Create, listening for the image responses it will trigger
+        create_btn = self._loc["create_button"].first
+        try:
+            await create_btn.wait_for(state="visible", timeout=5_000)
+            self._watch_image_responses(existing_urls)
+            await create_btn.click()
+        except Exception:
+            self._stop_watching_responses()
+            return FlowGenerationResult(
+                prompt=prompt,
+                success=False,
+                error="Create button not found or not clickable",
+            )
+        return existing_urls
+
+    async def _await_results(
+        self, prompt: str, existing_urls: set[str]
+    ) -> FlowGenerationResult:
+        """Wait for images that were not in ``existing_urls`` to appear."""
+        # Wait for NEW images to appear
+        timeout_s = self.config.generation_timeout / 1000
+        poll_interval = 5.0
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        elapsed = 0.0
+        new_image_urls: list[str] = []
+        ready_arg = [
+            self.config.selectors["generated_image"],
+            list(existing_urls),
+            self.config.images_per_prompt,
+        ]
+        all_ready = False
+
+        while elapsed < timeout_s:
+            # Check skip before waiting
+            if self.overlay and self.overlay.check_skip():
                 return FlowGenerationResult(
                     prompt=prompt,
                     success=False,
-                    error="Create button not found or not clickable",
+                    error="Skipped by user",
                 )
 
-            # Wait for NEW images to appear
-            timeout_s = self.config.generation_timeout / 1000
-            poll_interval = 5.0
-            elapsed = 0.0
-            new_image_urls: list[str] = []
-
-            while elapsed < timeout_s:
-                # Check skip before sleeping
-                if self.overlay and self.overlay.check_skip():
-                    return FlowGenerationResult(
-                        prompt=prompt,
-                        success=False,
-                        error="Skipped by user",
-                    )
+            # Wait until all expected images have rendered; slices of
+            # poll_interval keep skip/progress live.
+            try:
+                all_ready = await self._wait_for_new_images(
+                    ready_arg,
+                    timeout=max(1, min(poll_interval, timeout_s - elapsed) * 1000),
+                )
+            except Exception:
+                if self._is_page_alive():
+                    raise
+            elapsed = loop.time() - started
 
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
+            if self.overlay:
+                await self.overlay.update(
+                    status="Waiting for images...",
+                    sub=f"⏳ {elapsed:.0f}s / {timeout_s:.0f}s",
+                )
 
-                if self.overlay:
-                    await self.overlay.update(
-                        status="Waiting for images...",
-                        sub=f"⏳ {elapsed:.0f}s / {timeout_s:.0f}s",
-                    )
+            if not self._is_page_alive():
+                return FlowGenerationResult(
+                    prompt=prompt,
+                    success=False,
+                    error="Browser page was closed during generation",
+                )
 
-                if not self._is_page_alive():
-                    return FlowGenerationResult(
-                        prompt=prompt,
-                        success=False,
-                        error="Browser page was closed during generation",
+            if all_ready:
+                # All expected images found — give late arrivals up to 3s to
+                # land (done once the image count holds still for 1s), then
+                # take a single snapshot.
+                try:
+                    await self.page.wait_for_function(
+                        _IMAGE_COUNT_SETTLED_JS,
+                        arg=[self.config.selectors["generated_image"], 1000, started],
+                        polling=100,
+                        timeout=3_000,
                     )
+                except Exception:
+                    pass
+                await self._collect_new_images(existing_urls, new_image_urls)
+                break
 
-                # Collect all GCS image URLs
-                imgs = await self.page.locator(
-                    self.config.selectors["generated_image"]
-                ).all()
-                for img in imgs:
-                    try:
-                        if not await img.is_visible():
-                            continue
-                        src = await img.get_attribute("src") or ""
-                        if not src:
-                            continue
-                        base_url = src.split("?")[0]
-                        if base_url not in existing_urls and src not in new_image_urls:
-                            # Verify it's a real image (not a placeholder)
-                            dims = await img.evaluate(
-                                "el => ({w: el.naturalWidth, h: el.naturalHeight})"
-                            )
-                            if dims.get("w", 0) >= 256 and dims.get("h", 0) >= 256:
-                                new_image_urls.append(src)
-                    except Exception:
-                        continue
-
-                if new_image_urls:
-                    # Wait for all expected images (config.images_per_prompt)
-                    if len(new_image_urls) < self.config.images_per_prompt:
-                        # Not all images ready yet, keep polling
-                        continue
-                    # All expected images found — final sweep for any late-arriving images
-                    await asyncio.sleep(3)
-                    # Re-check for any additional images
-                    imgs = await self.page.locator(
-                        self.config.selectors["generated_image"]
-                    ).all()
-                    for img in imgs:
-                        try:
-                            if not await img.is_visible():
-                                continue
-                            src = await img.get_attribute("src") or ""
-                            if not src:
-                                continue
-                            base_url = src.split("?")[0]
-                            if (
-                                base_url not in existing_urls
-                                and src not in new_image_urls
-                            ):
-                                dims = await img.evaluate(
-                                    "el => ({w: el.naturalWidth, h: el.naturalHeight})"
-                                )
-                                if dims.get("w", 0) >= 256 and dims.get("h", 0) >= 256:
-                                    new_image_urls.append(src)
-                        except Exception:
-                            continue
-                    break
+        if not all_ready:
+            # Timed out: keep whatever subset of images did arrive
+            await self._collect_new_images(existing_urls, new_image_urls)
 
-            if not new_image_urls:
-                # Check for content policy / copyright rejection messages
-                rejection_error = await self._detect_content_rejection()
-                if rejection_error:
-                    return FlowGenerationResult(
-                        prompt=prompt,
-                        success=False,
-                        error=rejection_error,
-                    )
+        if not new_image_urls:
+            # Check for content policy / copyright rejection messages
+            rejection_error = await self._detect_content_rejection()
+            if rejection_error:
                 return FlowGenerationResult(
                     prompt=prompt,
                     success=False,
-                    error=f"Image generation timed out after {timeout_s:.0f}s",
+                    error=rejection_error,
                 )
-
             return FlowGenerationResult(
                 prompt=prompt,
-                image_urls=new_image_urls,
-                success=True,
+                success=False,
+                error=f"Image generation timed out after {timeout_s:.0f}s",
             )
 
-        except Exception as e:
-            return FlowGenerationResult(
-                prompt=prompt,
-                success=False,
-                error=str(e),
+        return FlowGenerationResult(
+            prompt=prompt,
+            image_urls=new_image_urls,
+            success=True,
+        )
+
+    async def _wait_for_new_images(self, ready_arg: list, timeout: float) -> bool:
+        """Wait up to ``timeout`` ms for all expected new images to render.
+
+        The page is polled every 500ms, or every 100ms once the image
+        responses watched since the Create click have all loaded. Returns
+        False on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+        if not self._responses_done.is_set():
+            dom_ready = asyncio.ensure_future(
+                self.page.wait_for_function(
+                    _NEW_IMAGES_READY_JS, arg=ready_arg, polling=500, timeout=timeout
+                )
+            )
+            net_ready = asyncio.ensure_future(self._responses_done.wait())
+            done, pending = await asyncio.wait(
+                {dom_ready, net_ready}, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            if dom_ready in done:
+                try:
+                    dom_ready.result()
+                except PlaywrightTimeoutError:
+                    return False
+                return True
+        # The images have loaded; they should render almost at once
+        try:
+            await self.page.wait_for_function(
+                _NEW_IMAGES_READY_JS,
+                arg=ready_arg,
+                polling=100,
+                timeout=max(1, (deadline - loop.time()) * 1000),
             )
+        except PlaywrightTimeoutError:
+            return False
+        return True
 
     async def generate_batch(
         self, prompts: list[str], reference_image: str | None = None
@@ -770,6 +1045,19 @@ class FlowImageGenerator:
         total = len(prompts)
         ref_uploaded = False
 
+        # Resolve and check the reference file once for the whole batch
+        self._reference_resolved = None
+        if reference_image:
+            resolved = Path(reference_image).resolve()
+            if not resolved.exists():
+                error = f"Reference image not found: {resolved}"
+                print(f"  ✗ {error}")
+                return [
+                    FlowGenerationResult(prompt=p, success=False, error=error)
+                    for p in prompts
+                ]
+            self._reference_resolved = resolved
+
         for i, prompt in enumerate(prompts, 1):
             print(
                 f"[{i}/{total}] Generating: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
@@ -806,9 +1094,16 @@ class FlowImageGenerator:
                 if reattach_err:
                     print(f"  Warning: {reattach_err}")
 
-            ref_for_this = reference_image if not ref_uploaded else None
-            result = await self.generate(prompt, reference_image=ref_for_this)
-            if reference_image and not ref_uploaded and result.success:
+            ref_for_this = self._reference_resolved if not ref_uploaded else None
+            # Prefill the next prompt while this one renders
+            next_prompt = prompts[i] if i < total else None
+            self._reference_uploaded = False
+            result = await self._generate(
+                prompt, reference_image=ref_for_this, next_prompt=next_prompt
+            )
+            # Once Flow has the file, later prompts always re-pick it from
+            # the picker, even if this prompt's generation itself failed
+            if ref_for_this and self._reference_uploaded:
                 ref_uploaded = True
 
             if result.success:
@@ -851,16 +1146,34 @@ class FlowImageDownloader:
     def __init__(self, page: Page, config: FlowConfig) -> None:
         self.page = page
         self.config = config
-
-    async def download(self, url: str, prompt: str, index: int) -> Path | None:
+        # Caps in-flight requests when a result's images are gathered at once
+        self._semaphore = asyncio.Semaphore(config.max_parallel_downloads or 8)
+
+    def _prompt_dir(self, prompt: str) -> Path:
+        """Create (if needed) and return the output subfolder for ``prompt``."""
+        prompt_dir = self.config.output_dir / _sanitize_filename(prompt)
+        prompt_dir.mkdir(parents=True, exist_ok=True)
+        return prompt_dir
+
+    async def download(
+        self, url: str, prompt: str, index: int, prompt_dir: Path | None = None
+    ) -> Path | None:
         """Download a single image and save to prompt-named subfolder.
 
         Structure: output_dir/{sanitized_prompt}/flow_{index}_{timestamp}.png
+
+        ``prompt_dir`` skips creating the subfolder when the caller already has.
         """
+        async with self._semaphore:
+            return await self._download(url, prompt, index, prompt_dir)
+
+    async def _download(
+        self, url: str, prompt: str, index: int, prompt_dir: Path | None
+    ) -> Path | None:
+        """Fetch one image and write it to disk. Returns None on failure."""
         try:
-            sanitized = _sanitize_filename(prompt)
-            prompt_dir = self.config.output_dir / sanitized
-            prompt_dir.mkdir(parents=True, exist_ok=True)
+            if prompt_dir is None:
+                prompt_dir = self._prompt_dir(prompt)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"flow_{index}_{timestamp}.png"
             filepath = prompt_dir / filename
@@ -872,12 +1185,20 @@ class FlowImageDownloader:
                 )
                 return None
 
+            # A declared-empty body is rejected before reading it; chunked
+            # responses carry no content-length and are checked after
+            if response.headers.get("content-length") == "0":
+                print(f"  Warning: Empty response for {url[:80]}")
+                return None
+
             body = await response.body()
             if not body:
                 print(f"  Warning: Empty response for {url[:80]}")
                 return None
 
-            filepath.write_bytes(embed_png_metadata(body, prompt))
+            # Metadata embedding and the write run off the event loop so
+            # other in-flight downloads keep progressing
+            await asyncio.to_thread(_write_png, filepath, body, prompt)
             return filepath
 
         except Exception as e:
@@ -885,20 +1206,37 @@ class FlowImageDownloader:
             return None
 
     async def download_all(self, result: FlowGenerationResult) -> list[Path]:
-        """Download all images from a generation result. Returns list of saved paths."""
-        saved: list[Path] = []
-        for i, url in enumerate(result.image_urls):
-            path = await self.download(url, result.prompt, i)
-            if path:
-                saved.append(path)
-        return saved
+        """Download all images from a generation result concurrently.
+
+        Returns the saved paths in image order.
+        """
+        try:
+            prompt_dir = self._prompt_dir(result.prompt)
+        except OSError as e:
+            print(f"  Warning: Download error: {e}")
+            return []
+        paths = await asyncio.gather(
+            *(
+                self.download(url, result.prompt, i, prompt_dir)
+                for i, url in enumerate(result.image_urls)
+            ),
+            return_exceptions=True,
+        )
+        return [path for path in paths if isinstance(path, Path)]
+
+
+def _write_png(filepath: Path, body: bytes, prompt: str) -> None:
+    """Embed the prompt into ``body`` and write it to ``filepath``."""
+    filepath.write_bytes(embed_png_metadata(body, prompt))
+
+
+_NON_WORD = re.compile(r"[^\w\-]", re.UNICODE)
+_MULTI_UNDERSCORE = re.compile(r"_+")
 
 
 def _sanitize_filename(text: str, max_length: int = 50) -> str:
     """Sanitize text for use as a filename."""
-    sanitized = re.sub(r"[^\w\-]", "_", text, flags=re.UNICODE)
-    sanitized = re.sub(r"_+", "_", sanitized)
-    sanitized = sanitized.strip("_")
+    sanitized = _MULTI_UNDERSCORE.sub("_", _NON_WORD.sub("_", text)).strip("_")
     if len(sanitized) > max_length:
         sanitized = sanitized[:max_length].rstrip("_")
     return sanitized or "image"
@@ -3,13 +3,86 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import random
 from dataclasses import dataclass, field
-from playwright.async_api import Page
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
 
 from gemini_automation.config import Config
 from gemini_automation.overlay import BrowserOverlay
 
+# One poll of the response: ``images`` is the src of every rendered
+# (non-hidden, non-zero-size) generated image whose natural size is at least
+# ``minDim`` on both sides; ``complete`` is whether the first
+# response-complete button (feedback buttons) is rendered.
+_SCAN_RESPONSE_JS = """([imageSelector, doneSelector, minDim]) => {
+    const rendered = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) return false;
+        return getComputedStyle(el).visibility !== 'hidden';
+    };
+    const images = [];
+    for (const el of document.querySelectorAll(imageSelector)) {
+        if (!rendered(el)) continue;
+        if (el.naturalWidth < minDim || el.naturalHeight < minDim) continue;
+        const src = el.getAttribute('src');
+        if (src) images.push(src);
+    }
+    const done = document.querySelector(doneSelector);
+    return {images, complete: !!done && rendered(done)};
+}"""
+
+# The scan above once there is something to act on (images or a finished
+# response), else false -- for use with wait_for_function.
+_RESPONSE_READY_JS = (
+    "(arg) => { const r = ("
+    + _SCAN_RESPONSE_JS
+    + ")(arg); return r.images.length || r.complete ? r : false; }"
+)
+
+# The scan above once the response has finished, else false.
+_RESPONSE_COMPLETE_JS = (
+    "(arg) => { const r = (" + _SCAN_RESPONSE_JS + ")(arg); return r.complete && r; }"
+)
+
+# Truthy once the previous chat's images and complete markers are gone
+_RESPONSE_CLEARED_JS = "(arg) => !(" + _RESPONSE_READY_JS + ")(arg)"
+
+logger = logging.getLogger(__name__)
+
+# Generated images smaller than this (either side) are UI thumbnails/avatars
+_MIN_IMAGE_DIM = 256
+
+_PROMO_DISMISS_SELECTORS = (
+    # EN: "No, thanks" / KR: various dismiss buttons
+    'button:has-text("No, thanks")',
+    'button:has-text("아니요")',
+    'button:has-text("괜찮습니다")',
+    'button:has-text("닫기")',
+    # Generic close/dismiss in overlay
+    '.cdk-overlay-container button:has-text("No")',
+    '.cdk-overlay-container button:has-text("아니")',
+)
+_OVERLAY_BACKDROP = ".cdk-overlay-container .cdk-overlay-backdrop"
+
+# Given promo dismiss buttons plus overlay backdrops: click the first
+# rendered button and return "clicked"; else return "backdrop" if a backdrop
+# is rendered (caller presses Escape); else null.
+_DISMISS_PROMO_JS = """(els, backdropSelector) => {
+    const rendered = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) return false;
+        return getComputedStyle(el).visibility !== 'hidden';
+    };
+    const backdrops = els.filter(el => el.matches(backdropSelector));
+    const button = els.find(el => !backdrops.includes(el) && rendered(el));
+    if (button) {
+        button.click();
+        return 'clicked';
+    }
+    return backdrops.some(rendered) ? 'backdrop' : null;
+}"""
+
 
 @dataclass
 class GenerationResult:
@@ -30,6 +103,23 @@ class ImageGenerator:
         self.page = page
         self.config = config
         self.overlay = overlay
+        # Set once a chat page has loaded; later chats start in-place
+        self._initialized = False
+        # Locators are lazy (resolved on each action), so one per selector key
+        # stays valid across navigations.
+        self._loc: dict[str, Locator] = {
+            key: page.locator(sel) for key, sel in config.selectors.items()
+        }
+        self._promo_loc = page.locator(
+            ", ".join([*_PROMO_DISMISS_SELECTORS, _OVERLAY_BACKDROP])
+        )
+        self._backdrop_loc = page.locator(_OVERLAY_BACKDROP)
+        # Built once and reused by every prompt on this page
+        self._scan = self._scan_arg()
+        self._tool_chip = self._loc["deselect_tool"].first
+        self._tools_btn = self._loc["tools_button"].first
+        self._create_images = self._loc["create_images_option"].first
+        self._new_chat_btn = self._loc["new_chat_button"].first
 
     async def _activate_create_images_tool(self) -> str | None:
         """Click Tools → Create images to activate image generation mode.
@@ -39,24 +129,28 @@ class ImageGenerator:
 
         Returns None on success, or an error message string on failure.
         """
+        # Already in image mode (tool chip shown): nothing to click
+        tool_chip = self._tool_chip
+        try:
+            if await tool_chip.is_visible():
+                return None
+        except Exception:
+            pass
+
         # Focus textarea to reveal the toolbar buttons
-        textarea = self.page.locator(self.config.selectors["textarea"])
+        textarea = self._loc["textarea"]
         await textarea.click()
-        await asyncio.sleep(1)
 
         # Click the "Tools" button
-        tools_btn = self.page.locator(self.config.selectors["tools_button"]).first
+        tools_btn = self._tools_btn
         try:
             await tools_btn.wait_for(state="visible", timeout=10_000)
         except Exception:
             return "Tools button not found on page"
         await tools_btn.click()
-        await asyncio.sleep(1)
 
         # Click "Create images" from the dropdown
-        create_images = self.page.locator(
-            self.config.selectors["create_images_option"]
-        ).first
+        create_images = self._create_images
         try:
             await create_images.wait_for(state="visible", timeout=5_000)
         except Exception:
@@ -64,7 +158,12 @@ class ImageGenerator:
             await self.page.keyboard.press("Escape")
             return "Create images option not found in Tools menu"
         await create_images.click()
-        await asyncio.sleep(1)
+
+        # The tool chip (with its Deselect button) shows the mode is active
+        try:
+            await tool_chip.wait_for(state="visible", timeout=5_000)
+        except Exception:
+            pass
         return None
 
     def _is_page_alive(self) -> bool:
@@ -74,274 +173,325 @@ class ImageGenerator:
         except Exception:
             return False
 
+    def _scan_arg(self, min_dim: int = _MIN_IMAGE_DIM) -> list:
+        """Argument for _SCAN_RESPONSE_JS and the waits built on it."""
+        return [
+            self.config.selectors["generated_image"],
+            self.config.selectors["response_complete"],
+            min_dim,
+        ]
+
     async def _dismiss_promo_dialogs(self) -> None:
         """Dismiss any promotional overlay dialogs (Deep Research, etc.).
 
         These dialogs appear in the cdk-overlay-container and block clicks
         on the textarea and toolbar buttons.
         """
-        dismiss_selectors = [
-            # EN: "No, thanks" / KR: various dismiss buttons
-            'button:has-text("No, thanks")',
-            'button:has-text("아니요")',
-            'button:has-text("괜찮습니다")',
-            'button:has-text("닫기")',
-            # Generic close/dismiss in overlay
-            '.cdk-overlay-container button:has-text("No")',
-            '.cdk-overlay-container button:has-text("아니")',
-        ]
-        for sel in dismiss_selectors:
-            try:
-                btn = self.page.locator(sel).first
-                if await btn.count() > 0 and await btn.is_visible():
-                    await btn.click()
-                    await asyncio.sleep(1)
-                    return
-            except Exception:
-                continue
-
-        # Fallback: press Escape to close any overlay
+        # One locator over the buttons and the backdrop; the probe and click
+        # happen in-page, so this is a single round-trip
         try:
-            overlay = self.page.locator(".cdk-overlay-container .cdk-overlay-backdrop")
-            if await overlay.count() > 0 and await overlay.is_visible():
+            found = await self._promo_loc.evaluate_all(
+                _DISMISS_PROMO_JS, _OVERLAY_BACKDROP
+            )
+            if found == "backdrop":
+                # Fallback: press Escape to close any overlay
                 await self.page.keyboard.press("Escape")
-                await asyncio.sleep(1)
+            if found:
+                # Promo dialogs sit on a backdrop that goes once they close
+                await self._backdrop_loc.first.wait_for(state="hidden", timeout=5_000)
         except Exception:
             pass
 
     async def generate(self, prompt: str) -> GenerationResult:
         """Generate images for a single prompt in a new chat."""
+        return await self._generate(prompt)
+
+    async def _generate(
+        self, prompt: str, prepared: asyncio.Task | None = None
+    ) -> GenerationResult:
+        """Generate images for ``prompt``.
+
+        ``prepared`` is a _prepare_page() task started ahead of time (during
+        the previous inter-prompt delay); without it the page is prepared now.
+        """
         try:
-            # Navigate to new chat
+            if prepared is None:
+                prep_error = await self._prepare_page()
+            else:
+                prep_error = await prepared
+            if prep_error:
+                return GenerationResult(prompt=prompt, success=False, error=prep_error)
+            return await self._send_and_collect(prompt)
+        except Exception as e:
+            return GenerationResult(
+                prompt=prompt,
+                success=False,
+                error=str(e),
+            )
+
+    async def _prepare_page(self, announce: bool = True) -> str | None:
+        """Open a new chat with the Create images tool active.
+
+        With ``announce`` False the overlay is left alone, so this can run
+        in the background while the overlay shows the inter-prompt wait.
+
+        Returns None on success, or an error message string on failure.
+        """
+        # Navigate to new chat (in-place when the app is already loaded)
+        if not await self._start_new_chat():
             await self.page.goto(self.config.gemini_url, wait_until="domcontentloaded")
 
-            if self.overlay:
-                await self.overlay.update(
-                    status="Loading page...",
-                    skip_enabled=True,
-                    next_enabled=False,
-                )
+        if self.overlay and announce:
+            await self.overlay.update(
+                status="Loading page...",
+                skip_enabled=True,
+                next_enabled=False,
+            )
 
-            # Wait for textarea
-            textarea = self.page.locator(self.config.selectors["textarea"])
-            try:
-                await textarea.wait_for(state="visible", timeout=30_000)
-            except Exception:
-                return GenerationResult(
-                    prompt=prompt,
-                    success=False,
-                    error="Textarea not found - may not be logged in",
-                )
+        # Wait for textarea
+        textarea = self._loc["textarea"]
+        try:
+            await textarea.wait_for(state="visible", timeout=30_000)
+        except Exception:
+            return "Textarea not found - may not be logged in"
+        self._initialized = True
+
+        # Dismiss any promo dialogs that may block interaction
+        await self._dismiss_promo_dialogs()
+
+        if self.overlay and announce:
+            await self.overlay.update(status="Activating image tool...")
+
+        # Activate "Create images" tool BEFORE entering prompt.
+        # Without this, Gemini generates text instead of images.
+        tool_error = await self._activate_create_images_tool()
+        if tool_error:
+            return f"Failed to activate image tool: {tool_error}"
+        return None
+
+    async def _start_new_chat(self) -> bool:
+        """Click "New chat" instead of reloading the app.
+
+        Returns False when a full page.goto is needed: on the first prompt,
+        when the page has left Gemini, or when the button is unavailable.
+        """
+        if not self._initialized or not self.page.url.startswith(
+            self.config.gemini_url
+        ):
+            return False
+        try:
+            await self._new_chat_btn.click(timeout=5_000)
+            # The previous chat's images and feedback buttons must be gone,
+            # or the next scan would pick them up
+            await self.page.wait_for_function(
+                _RESPONSE_CLEARED_JS,
+                arg=self._scan,
+                polling=100,
+                timeout=5_000,
+            )
+        except Exception:
+            return False
+        return True
 
-            # Dismiss any promo dialogs that may block interaction
-            await self._dismiss_promo_dialogs()
+    async def _send_and_collect(self, prompt: str) -> GenerationResult:
+        """Send ``prompt`` on the prepared page and wait for its images."""
+        textarea = self._loc["textarea"]
 
-            if self.overlay:
-                await self.overlay.update(status="Activating image tool...")
+        if self.overlay:
+            await self.overlay.update(
+                status=f"Sending: {prompt[:60]}{'…' if len(prompt) > 60 else ''}",
+            )
 
-            # Activate "Create images" tool BEFORE entering prompt.
-            # Without this, Gemini generates text instead of images.
-            tool_error = await self._activate_create_images_tool()
-            if tool_error:
+        # Enter prompt and send
+        await textarea.click()
+        await textarea.fill(prompt)
+        await asyncio.sleep(0.5)
+        await self.page.keyboard.press("Enter")
+
+        # Wait for REAL generated images (not UI thumbnails/avatars).
+        # Everything the loop touches is bound to locals up front.
+        page = self.page
+        overlay = self.overlay
+        poll_interval = 5.0
+        timeout_s = self.config.generation_timeout / 1000
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        elapsed = 0.0
+        image_urls: list[str] = []
+        seen: set[str] = set()
+        scan_arg = self._scan
+
+        while elapsed < timeout_s:
+            # Check skip before waiting
+            if overlay and overlay.check_skip():
                 return GenerationResult(
                     prompt=prompt,
                     success=False,
-                    error=f"Failed to activate image tool: {tool_error}",
+                    error="Skipped by user",
                 )
 
-            if self.overlay:
-                await self.overlay.update(
-                    status=f"Sending: {prompt[:60]}{'…' if len(prompt) > 60 else ''}",
+            # Let the browser poll (every 500ms) until images pass the size
+            # threshold or the response completes; slices of
+            # poll_interval keep skip/progress live.
+            scan = None
+            try:
+                handle = await page.wait_for_function(
+                    _RESPONSE_READY_JS,
+                    arg=scan_arg,
+                    polling=500,
+                    timeout=max(1, min(poll_interval, timeout_s - elapsed) * 1000),
                 )
-
-            # Enter prompt and send
-            await textarea.click()
-            await textarea.fill(prompt)
-            await asyncio.sleep(0.5)
-            await self.page.keyboard.press("Enter")
-
-            # Wait for REAL generated images (not UI thumbnails/avatars).
-            min_dim = 256
-            poll_interval = 5.0
-            timeout_s = self.config.generation_timeout / 1000
-            elapsed = 0.0
-            image_urls: list[str] = []
-
-            while elapsed < timeout_s:
-                # Check skip before sleeping
-                if self.overlay and self.overlay.check_skip():
-                    return GenerationResult(
-                        prompt=prompt,
-                        success=False,
-                        error="Skipped by user",
-                    )
-
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
-
-                if self.overlay:
-                    await self.overlay.update(
-                        status="Waiting for images...",
-                        sub=f"⏳ {elapsed:.0f}s / {timeout_s:.0f}s",
-                    )
-
-                # Guard: check page is still alive
-                if not self._is_page_alive():
+                scan = await handle.json_value()
+            except PlaywrightTimeoutError:
+                pass
+            except Exception:
+                if self._is_page_alive():
                     return GenerationResult(
                         prompt=prompt,
                         success=False,
-                        error="Browser page was closed during generation",
+                        error="Lost connection to browser during generation",
                     )
+            elapsed = loop.time() - started
 
-                # Check if Gemini finished responding (feedback buttons appear)
-                response_complete = False
-                try:
-                    good_btn = self.page.locator(
-                        self.config.selectors["response_complete"]
-                    )
-                    if await good_btn.count() > 0 and await good_btn.first.is_visible():
-                        response_complete = True
-                except Exception:
-                    pass
+            if overlay:
+                await overlay.update(
+                    status="Waiting for images...",
+                    sub=f"⏳ {elapsed:.0f}s / {timeout_s:.0f}s",
+                )
 
-                # Collect real images
-                image_locator = self.page.locator(
-                    self.config.selectors["generated_image"]
+            # Guard: check page is still alive
+            if not self._is_page_alive():
+                return GenerationResult(
+                    prompt=prompt,
+                    success=False,
+                    error="Browser page was closed during generation",
                 )
-                try:
-                    elements = await image_locator.all()
-                except Exception:
-                    return GenerationResult(
-                        prompt=prompt,
-                        success=False,
-                        error="Lost connection to browser during generation",
-                    )
 
-                for el in elements:
-                    try:
-                        visible = await el.is_visible()
-                        if not visible:
-                            continue
-                        dims = await el.evaluate(
-                            "el => ({w: el.naturalWidth, h: el.naturalHeight})"
-                        )
-                        if dims.get("w", 0) >= min_dim and dims.get("h", 0) >= min_dim:
-                            src = await el.get_attribute("src")
-                            if src and src not in image_urls:
-                                image_urls.append(src)
-                    except Exception:
-                        continue
+            if scan is None:
+                continue
 
-                if image_urls:
-                    # Found images — wait a bit for more, then collect
-                    await asyncio.sleep(3)
+            if scan["images"]:
+                # Found images — give the rest up to 3s to land (done
+                # once Gemini marks the response complete), then collect
+                # both scans once
+                found = scan["images"]
+                if not scan["complete"]:
                     try:
-                        elements = await image_locator.all()
+                        handle = await page.wait_for_function(
+                            _RESPONSE_COMPLETE_JS,
+                            arg=scan_arg,
+                            polling=250,
+                            timeout=3_000,
+                        )
+                        scan = await handle.json_value()
                     except Exception:
-                        break
-                    for el in elements:
                         try:
-                            visible = await el.is_visible()
-                            if not visible:
-                                continue
-                            dims = await el.evaluate(
-                                "el => ({w: el.naturalWidth, h: el.naturalHeight})"
-                            )
-                            if (
-                                dims.get("w", 0) >= min_dim
-                                and dims.get("h", 0) >= min_dim
-                            ):
-                                src = await el.get_attribute("src")
-                                if src and src not in image_urls:
-                                    image_urls.append(src)
+                            scan = await page.evaluate(_SCAN_RESPONSE_JS, scan_arg)
                         except Exception:
-                            continue
-                    break
-
-                # Response finished but NO images → text-only (refusal/error)
-                if response_complete and not image_urls:
-                    return GenerationResult(
-                        prompt=prompt,
-                        success=False,
-                        error="Gemini responded with text only (likely refused due to content policy)",
-                    )
+                            pass
+                for src in (*found, *scan["images"]):
+                    if src not in seen:
+                        seen.add(src)
+                        image_urls.append(src)
+                break
 
-            if not image_urls:
+            # Response finished but NO images → text-only (refusal/error)
+            if scan["complete"]:
                 return GenerationResult(
                     prompt=prompt,
                     success=False,
-                    error=f"Image generation timed out after {timeout_s:.0f}s",
+                    error="Gemini responded with text only (likely refused due to content policy)",
                 )
 
-            return GenerationResult(
-                prompt=prompt,
-                image_urls=image_urls,
-                success=True,
-            )
-
-        except Exception as e:
+        if not image_urls:
             return GenerationResult(
                 prompt=prompt,
                 success=False,
-                error=str(e),
+                error=f"Image generation timed out after {timeout_s:.0f}s",
             )
 
+        return GenerationResult(
+            prompt=prompt,
+            image_urls=image_urls,
+            success=True,
+        )
+
     async def generate_batch(self, prompts: list[str]) -> list[GenerationResult]:
         """Generate images for multiple prompts sequentially with delays."""
         results = []
         total = len(prompts)
-
-        for i, prompt in enumerate(prompts, 1):
-            print(
-                f"[{i}/{total}] Generating: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
-            )
-
-            if self.overlay:
-                await self.overlay.update(
-                    progress=f"{i} / {total}",
-                    status=f"Starting: {prompt[:50]}{'…' if len(prompt) > 50 else ''}",
-                    sub="",
-                    skip_enabled=True,
-                    next_enabled=False,
+        # Next prompt's page setup, started during the inter-prompt delay
+        # (when there is no overlay)
+        prepared: asyncio.Task | None = None
+        try:
+            for i, prompt in enumerate(prompts, 1):
+                logger.info(
+                    "[%d/%d] Generating: %s%s",
+                    i,
+                    total,
+                    prompt[:50],
+                    "..." if len(prompt) > 50 else "",
                 )
 
-            # Guard: abort remaining prompts if browser died
-            if not self._is_page_alive():
-                print("  ✗ Browser closed — skipping remaining prompts")
-                for remaining in prompts[i - 1 :]:
-                    results.append(
-                        GenerationResult(
-                            prompt=remaining,
-                            success=False,
-                            error="Browser was closed before this prompt",
-                        )
+                if self.overlay:
+                    await self.overlay.update(
+                        progress=f"{i} / {total}",
+                        status=f"Starting: {prompt[:50]}{'…' if len(prompt) > 50 else ''}",
+                        sub="",
+                        skip_enabled=True,
+                        next_enabled=False,
                     )
-                break
 
-            result = await self.generate(prompt)
+                # Guard: abort remaining prompts if browser died
+                if not self._is_page_alive():
+                    logger.info("  ✗ Browser closed — skipping remaining prompts")
+                    for remaining in prompts[i - 1 :]:
+                        results.append(
+                            GenerationResult(
+                                prompt=remaining,
+                                success=False,
+                                error="Browser was closed before this prompt",
+                            )
+                        )
+                    break
 
-            if result.success:
-                print(f"  ✓ Got {len(result.image_urls)} image(s)")
-            else:
-                print(f"  ✗ Failed: {result.error}")
+                result = await self._generate(prompt, prepared)
+                prepared = None
+
+                if result.success:
+                    logger.info("  ✓ Got %d image(s)", len(result.image_urls))
+                else:
+                    logger.info("  ✗ Failed: %s", result.error)
 
-            results.append(result)
+                results.append(result)
 
-            # Random delay between prompts (skip after last)
-            if i < total:
-                delay = random.uniform(self.config.min_delay, self.config.max_delay)
-                print(f"  Waiting {delay:.1f}s before next prompt...")
+                # Random delay between prompts (skip after last)
+                if i < total:
+                    delay = random.uniform(self.config.min_delay, self.config.max_delay)
+                    logger.info("  Waiting %.1fs before next prompt...", delay)
 
-                if self.overlay:
-                    await self.overlay.update(
-                        status=f"✓ Done — waiting {delay:.0f}s",
-                        sub="Click Next to skip wait",
-                        skip_enabled=False,
-                        next_enabled=True,
-                    )
-                    await self.overlay.wait_for_next_or_timeout(delay)
-                else:
-                    await asyncio.sleep(delay)
+                    if self.overlay:
+                        await self.overlay.update(
+                            status=f"✓ Done — waiting {delay:.0f}s",
+                            sub="Click Next to skip wait",
+                            skip_enabled=False,
+                            next_enabled=True,
+                        )
+                        # Not prepared during the wait: a fallback page.goto
+                        # would wipe the overlay and its Next button
+                        await self.overlay.wait_for_next_or_timeout(delay)
+                    else:
+                        # Load the next chat while we wait out the delay
+                        prepared = asyncio.create_task(
+                            self._prepare_page(announce=False)
+                        )
+                        await asyncio.sleep(delay)
+        finally:
+            # Don't leave the next chat loading after the batch ends (or is
+            # cancelled or fails)
+            if prepared is not None:
+                prepared.cancel()
+                await asyncio.gather(prepared, return_exceptions=True)
 
         if self.overlay:
             await self.overlay.update(
@@ -352,3 +502,41 @@ class ImageGenerator:
             )
 
         return results
+
+    async def generate_batch_parallel(
+        self, prompts: list[str], tabs: int | None = None
+    ) -> list[GenerationResult]:
+        """Generate prompts across several chat tabs at once.
+
+        Prompts are dealt round-robin to ``tabs`` (default
+        ``config.parallel_tabs``) tabs in this page's browser context. This
+        generator's page, and its overlay, runs the first shard; the extra
+        tabs run without an overlay and are closed afterwards. Results keep
+        prompt order.
+        """
+        tabs = min(tabs or self.config.parallel_tabs, len(prompts))
+        if tabs <= 1:
+            return await self.generate_batch(prompts)
+
+        pages = await asyncio.gather(
+            *(self.page.context.new_page() for _ in range(tabs - 1))
+        )
+        generators = [self] + [ImageGenerator(page, self.config) for page in pages]
+        try:
+            shard_results = await asyncio.gather(
+                *(
+                    gen.generate_batch(prompts[k::tabs])
+                    for k, gen in enumerate(generators)
+                )
+            )
+        finally:
+            for page in pages:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+        results: list[GenerationResult] = [None] * len(prompts)
+        for k, shard in enumerate(shard_results):
+            results[k::tabs] = shard
+        return results
@@ -1,26 +1,34 @@
 """Parallel multi-account image generation.
 
-Distributes prompts across multiple Google accounts using a shared
-asyncio.Queue. Each account runs its own Chrome browser and processes
-prompts from the queue until it's empty.
+Distributes prompts across multiple Google accounts. Every account's
+Chrome browser (checked out of a BrowserPool) is started up front; each
+then takes the next prompt index from a shared counter until the list is
+exhausted. Generated images are downloaded by a separate set of workers,
+so each browser goes straight on to its next prompt.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
+import json
 import random
-from dataclasses import dataclass, field
+import uuid
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from pathlib import Path
 
-from playwright.async_api import async_playwright, Playwright
+from playwright.async_api import BrowserContext
 
 from gemini_automation.accounts import AccountManager
+from gemini_automation.browser_pool import BrowserPool
 from gemini_automation.config import Config
 from gemini_automation.downloader import ImageDownloader
 from gemini_automation.generator import ImageGenerator, GenerationResult
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParallelResult:
     """Result of a single prompt including which account processed it."""
 
@@ -32,79 +40,221 @@ class ParallelResult:
     error: str | None = None
 
 
-async def _account_worker(
-    pw: Playwright,
-    account_name: str,
-    config: Config,
-    queue: asyncio.Queue[tuple[int, str]],
-    results: dict[int, ParallelResult],
-    min_delay: float,
-    max_delay: float,
-) -> None:
-    """Worker coroutine: one Chrome browser per account, pulls prompts from queue."""
-    context = None
+# Max time to get one account's browser up before starting without it
+BOOTSTRAP_TIMEOUT = 30.0
+
+# Every finished prompt is appended here (in the output dir) as it
+# completes; each run gets its own file
+RESULTS_FILE = "parallel_results_{run_id}.jsonl"
+
+
+@dataclass
+class _Worker:
+    """An account's checked-out browser and the helpers bound to its page."""
+
+    account_name: str
+    config: Config
+    context: BrowserContext
+    generator: ImageGenerator
+    downloader: ImageDownloader
+    # Set when the worker hit an account-level error; its browser is then
+    # closed instead of going back to the pool
+    crashed: bool = False
+    # Generations queued for download (or downloading) from this browser
+    pending_downloads: int = 0
+
+
+async def _bootstrap(pool: BrowserPool, account_name: str, config: Config) -> _Worker:
+    """Check out the account's browser and build its generator/downloader."""
+    context = await pool.acquire(config)
     try:
-        context = await pw.chromium.launch_persistent_context(
-            user_data_dir=str(config.profile_dir.resolve()),
-            channel="chrome",
-            headless=False,
-            args=config.browser_args,
-            viewport={"width": 1920, "height": 1080},
-            no_viewport=False,
-        )
         page = context.pages[0] if context.pages else await context.new_page()
+    except BaseException:
+        # Includes the BOOTSTRAP_TIMEOUT cancel; the pool shields its own
+        # launch, this covers the context once it has been handed over
+        await pool.release(context, config, discard=True)
+        raise
+    return _Worker(
+        account_name=account_name,
+        config=config,
+        context=context,
+        generator=ImageGenerator(page, config),
+        downloader=ImageDownloader(page, config),
+    )
+
+
+def _unprocessed_row(prompt: str) -> dict:
+    """Summary row for a prompt no worker got to."""
+    return {
+        "prompt": prompt,
+        "account": None,
+        "success": False,
+        "images": [],
+        "error": "Prompt was not processed (all workers failed)",
+    }
+
+
+def _append_lines(path: Path, lines: str) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        f.write(lines)
 
-        generator = ImageGenerator(page, config)
-        downloader = ImageDownloader(page, config)
 
+async def _write_results(
+    result_queue: asyncio.Queue[tuple[int, ParallelResult] | None],
+    path: Path,
+    run_id: str,
+    rows: dict[int, dict],
+) -> None:
+    """Writer coroutine: appends finished results to ``path`` as JSON lines.
+
+    Runs until it takes the ``None`` sentinel. Whatever is queued at the
+    time is written in one go. Each line is tagged with ``run_id``; the
+    summary row of each result is also kept in ``rows``, by prompt index.
+    """
+    done = False
+    while not done:
+        batch = [await result_queue.get()]
+        while not result_queue.empty():
+            batch.append(result_queue.get_nowait())
+        lines = []
+        for item in batch:
+            if item is None:
+                done = True
+                continue
+            idx, pr = item
+            lines.append(
+                json.dumps(
+                    {"run_id": run_id, "index": idx, **asdict(pr)}, ensure_ascii=False
+                )
+            )
+            rows[idx] = {
+                "prompt": pr.prompt,
+                "account": pr.account,
+                "success": pr.success,
+                "images": pr.saved_files,
+                "error": pr.error,
+            }
+        if lines:
+            try:
+                await asyncio.to_thread(_append_lines, path, "\n".join(lines) + "\n")
+            except OSError as e:
+                # Keep consuming so workers never block on a full queue
+                print(f"  Could not write {path.name}: {e}")
+
+
+# Item handed from a generate worker to the download workers
+_DownloadItem = tuple[int, _Worker, GenerationResult]
+
+
+async def _drain_prompts(
+    pool: BrowserPool,
+    worker: _Worker,
+    counter: Iterator[int],
+    prompts: list[str],
+    displays: list[str],
+    download_queue: asyncio.Queue[_DownloadItem | None],
+    result_queue: asyncio.Queue[tuple[int, ParallelResult] | None],
+    inflight: asyncio.Semaphore,
+    delays: list[float],
+) -> None:
+    """Generate worker: takes prompt indexes from ``counter`` until the
+    list is exhausted.
+
+    ``counter`` is shared by all workers; next() never yields to the event
+    loop, so no two workers get the same index. ``inflight`` is shared by
+    all workers and caps concurrent generations. ``delays[idx]`` is the
+    pause taken before prompt ``idx``.
+
+    Successful generations go to ``download_queue``, so the browser moves
+    on to the next prompt while the images download; failures go straight
+    to ``result_queue``.
+    """
+    account_name = worker.account_name
+    generator = worker.generator
+    try:
         first_prompt = True
         while True:
-            try:
-                idx, prompt = queue.get_nowait()
-            except asyncio.QueueEmpty:
+            idx = next(counter)
+            if idx >= len(prompts):
                 break
+            prompt = prompts[idx]
 
             # Stagger: small delay before first prompt per account (avoid launch spike)
             if first_prompt:
                 await asyncio.sleep(random.uniform(0.5, 2.0))
                 first_prompt = False
             else:
-                delay = random.uniform(min_delay, max_delay)
-                await asyncio.sleep(delay)
+                await asyncio.sleep(delays[idx])
 
-            print(
-                f"  [{account_name}] Generating: {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
-            )
+            print(f"  [{account_name}] Generating: {displays[idx]}")
 
-            gen_result = await generator.generate(prompt)
+            async with inflight:
+                gen_result = await generator.generate(prompt)
+
+            if gen_result.success:
+                worker.pending_downloads += 1
+                await download_queue.put((idx, worker, gen_result))
+                continue
 
+            print(f"  [{account_name}] ✗ {gen_result.error}")
             pr = ParallelResult(
                 prompt=prompt,
                 account=account_name,
-                success=gen_result.success,
                 image_urls=gen_result.image_urls,
+                success=False,
                 error=gen_result.error,
             )
-
-            if gen_result.success:
-                dl_result = await downloader.download_all(gen_result)
-                pr.saved_files = [str(p) for p in dl_result.saved_files]
-                print(f"  [{account_name}] ✓ {len(pr.saved_files)} image(s)")
-            else:
-                print(f"  [{account_name}] ✗ {gen_result.error}")
-
-            results[idx] = pr
-            queue.task_done()
+            await result_queue.put((idx, pr))
 
     except Exception as e:
-        # Account-level failure: drain remaining items back to queue? No — just log.
+        # Account-level failure: the remaining prompts go to other workers
         print(f"  [{account_name}] Worker crashed: {e}")
-    finally:
-        if context:
-            try:
-                await context.close()
-            except Exception:
-                pass
+        # Close the (possibly broken) browser instead of holding it until
+        # the batch ends: now, or once its queued downloads are done
+        worker.crashed = True
+        if not worker.pending_downloads:
+            await pool.release(worker.context, worker.config, discard=True)
+
+
+async def _download_results(
+    pool: BrowserPool,
+    download_queue: asyncio.Queue[_DownloadItem | None],
+    result_queue: asyncio.Queue[tuple[int, ParallelResult] | None],
+) -> None:
+    """Download worker: saves queued generations' images until it takes the
+    ``None`` sentinel.
+
+    Each item is downloaded through the downloader of the account that
+    generated it, since image URLs need that account's cookies. A crashed
+    worker's browser is closed here once its last queued item is done.
+    """
+    while (item := await download_queue.get()) is not None:
+        idx, worker, gen_result = item
+        account_name = worker.account_name
+        try:
+            dl_result = await worker.downloader.download_all(gen_result)
+        except Exception as e:
+            print(f"  [{account_name}] ✗ Download failed: {e}")
+            pr = ParallelResult(
+                prompt=gen_result.prompt,
+                account=account_name,
+                image_urls=gen_result.image_urls,
+                error=f"Download failed: {e}",
+            )
+        else:
+            saved_files = [str(p) for p in dl_result.saved_files]
+            print(f"  [{account_name}] ✓ {len(saved_files)} image(s)")
+            pr = ParallelResult(
+                prompt=gen_result.prompt,
+                account=account_name,
+                image_urls=gen_result.image_urls,
+                saved_files=saved_files,
+                success=True,
+            )
+        worker.pending_downloads -= 1
+        if worker.crashed and not worker.pending_downloads:
+            await pool.release(worker.context, worker.config, discard=True)
+        await result_queue.put((idx, pr))
 
 
 async def run_parallel(
@@ -113,6 +263,7 @@ async def run_parallel(
     base_dir: Path,
     output_dir: Path | None = None,
     max_concurrent: int | None = None,
+    pool: BrowserPool | None = None,
 ) -> dict:
     """Run image generation across multiple accounts in parallel.
 
@@ -121,7 +272,11 @@ async def run_parallel(
         account_names: Account names to use. Use ["all"] to use all accounts.
         base_dir: Project root directory.
         output_dir: Override output directory.
-        max_concurrent: Max simultaneous browsers (default: len(accounts)).
+        max_concurrent: Max generations running at once (default: one per
+            account). Every account's browser still starts and stays warm;
+            only the generate step is throttled.
+        pool: Browser pool to reuse across calls. Without one, a pool is
+            created for this call and its browsers are closed at the end.
 
     Returns:
         JSON-serializable result dict.
@@ -153,18 +308,19 @@ async def run_parallel(
                 "failed": len(prompts),
             }
 
-    # Limit concurrency
+    # One worker per account (no point running more workers than prompts);
+    # max_concurrent caps generations in flight, not browsers
+    active_accounts = account_names[: len(prompts)]
     effective_concurrent = min(
-        max_concurrent or len(account_names),
-        len(account_names),
-        len(prompts),  # No point running more workers than prompts
+        max_concurrent or len(active_accounts), len(active_accounts)
     )
-    active_accounts = account_names[:effective_concurrent]
 
     print(
         f"Parallel generation: {len(prompts)} prompts across {len(active_accounts)} account(s)"
     )
     print(f"  Accounts: {', '.join(active_accounts)}")
+    if effective_concurrent < len(active_accounts):
+        print(f"  At most {effective_concurrent} generating at once")
 
     # Build configs
     configs: dict[str, Config] = {}
@@ -172,68 +328,121 @@ async def run_parallel(
         cfg = Config.for_account(name, base_dir=base_dir)
         if output_dir:
             cfg.output_dir = output_dir
-        cfg.ensure_dirs()
         configs[name] = cfg
-        mgr.update_last_used(name)
-
-    # Fill queue with (index, prompt) tuples
-    queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
-    for i, prompt in enumerate(prompts):
-        queue.put_nowait((i, prompt))
-
-    # Results indexed by prompt order
-    results: dict[int, ParallelResult] = {}
+    mgr.update_last_used(*active_accounts)
+
+    # Accounts share the output dir, so create each distinct dir just once
+    for d in {d for cfg in configs.values() for d in (cfg.profile_dir, cfg.output_dir)}:
+        d.mkdir(parents=True, exist_ok=True)
+
+    # Workers claim prompts by index from this shared counter
+    counter = itertools.count()
+    # Log form of each prompt, truncated once here rather than per dequeue
+    displays = [p if len(p) <= 50 else p[:50] + "..." for p in prompts]
+    # Pause before each prompt, drawn up front for the whole batch
+    # (every account config shares the same delay settings)
+    first_cfg = configs[active_accounts[0]]
+    min_delay, max_delay = first_cfg.min_delay, first_cfg.max_delay
+    delays = [random.uniform(min_delay, max_delay) for _ in prompts]
+
+    # Finished results stream to the writer, which also keeps the summary
+    # rows returned below; the bounded queue holds back workers if it lags
+    run_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+    results_path = configs[active_accounts[0]].output_dir / RESULTS_FILE.format(
+        run_id=run_id
+    )
+    rows: dict[int, dict] = {}
+    result_queue: asyncio.Queue[tuple[int, ParallelResult] | None] = asyncio.Queue(
+        maxsize=effective_concurrent * 4
+    )
+    writer = asyncio.create_task(
+        _write_results(result_queue, results_path, run_id, rows)
+    )
+    workers: list[_Worker] = []
 
     # Run workers
-    async with async_playwright() as pw:
-        tasks = [
-            asyncio.create_task(
-                _account_worker(
-                    pw=pw,
-                    account_name=name,
-                    config=configs[name],
-                    queue=queue,
-                    results=results,
-                    min_delay=configs[name].min_delay,
-                    max_delay=configs[name].max_delay,
+    own_pool = pool is None
+    if own_pool:
+        pool = BrowserPool()
+    try:
+        # Bring every account's browser up at once, before any prompt is
+        # taken; an account that fails or stalls is left out of the batch
+        booted = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    _bootstrap(pool, name, configs[name]), BOOTSTRAP_TIMEOUT
                 )
-            )
-            for name in active_accounts
-        ]
+                for name in active_accounts
+            ),
+            return_exceptions=True,
+        )
+        for name, worker in zip(active_accounts, booted):
+            if isinstance(worker, _Worker):
+                workers.append(worker)
+            else:
+                print(f"  [{name}] Browser failed to start: {worker!r}")
+
+        inflight = asyncio.Semaphore(effective_concurrent)
+        # Generate and download workers run as two stages joined by this
+        # queue; one download worker per account
+        download_queue: asyncio.Queue[_DownloadItem | None] = asyncio.Queue(
+            maxsize=len(workers) * 2 or 1
+        )
 
-        # Wait for all workers to finish
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Structured: on cancel (Ctrl-C) or an escaped error every worker is
+        # cancelled and awaited before the browsers are released
+        try:
+            async with asyncio.TaskGroup() as tg:
+                download_tasks = [
+                    tg.create_task(
+                        _download_results(pool, download_queue, result_queue)
+                    )
+                    for _ in workers
+                ]
+                async with asyncio.TaskGroup() as generate_tg:
+                    for worker in workers:
+                        generate_tg.create_task(
+                            _drain_prompts(
+                                pool=pool,
+                                worker=worker,
+                                counter=counter,
+                                prompts=prompts,
+                                displays=displays,
+                                download_queue=download_queue,
+                                result_queue=result_queue,
+                                inflight=inflight,
+                                delays=delays,
+                            )
+                        )
+                # All generations are queued; let the downloads finish
+                for _ in download_tasks:
+                    await download_queue.put(None)
+        except* Exception as eg:
+            for exc in eg.exceptions:
+                print(f"  Worker failed: {exc!r}")
+    finally:
+        # Released only after the downloads, which use the browsers'
+        # cookies (crashed workers' browsers are already closed)
+        for worker in workers:
+            await worker.downloader.close()
+            await pool.release(worker.context, worker.config, discard=worker.crashed)
+        await result_queue.put(None)
+        await writer
+        if own_pool:
+            await pool.close()
 
     # Build ordered result list
-    all_results = []
-    for i, prompt in enumerate(prompts):
-        if i in results:
-            pr = results[i]
-            all_results.append(
-                {
-                    "prompt": pr.prompt,
-                    "account": pr.account,
-                    "success": pr.success,
-                    "images": pr.saved_files,
-                    "error": pr.error,
-                }
-            )
-        else:
-            all_results.append(
-                {
-                    "prompt": prompt,
-                    "account": None,
-                    "success": False,
-                    "images": [],
-                    "error": "Prompt was not processed (all workers failed)",
-                }
-            )
+    all_results = [
+        rows.get(i) or _unprocessed_row(prompt) for i, prompt in enumerate(prompts)
+    ]
 
-    successful = sum(1 for r in all_results if r["success"])
+    successful = sum(r["success"] for r in all_results)
     return {
         "results": all_results,
         "total_prompts": len(prompts),
         "successful": successful,
         "failed": len(all_results) - successful,
         "accounts_used": active_accounts,
+        "run_id": run_id,
+        "results_file": str(results_path),
     }
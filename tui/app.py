@@ -7,6 +7,11 @@ from textual.app import App
 from textual.binding import Binding
 from textual.reactive import reactive
 
+from gemini_automation.accounts import AccountManager
+from tui.screens.accounts import AccountScreen
+from tui.screens.main import MainScreen
+from tui.screens.settings import SettingsScreen
+
 
 class GeminiApp(App):
     """Gemini Image Generator TUI."""
@@ -29,28 +34,29 @@ class GeminiApp(App):
     max_delay: float = 10.0
     generation_timeout: float = 120_000
     output_dir: Path = Path("./output")
+    # Queue items generated at once; an account's items share its browser,
+    # each in its own tab
+    max_parallel: int = 1
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Shared by every screen, so accounts.json is only re-read when it
+        # changes rather than on each screen push
+        self.account_mgr = AccountManager()
 
     def on_mount(self) -> None:
         """Start on AccountScreen."""
-        from tui.screens.accounts import AccountScreen
-
         self.install_screen(AccountScreen(), name="accounts")
         self.push_screen("accounts")
 
     def action_switch_accounts(self) -> None:
         """Switch to account management screen."""
-        from tui.screens.accounts import AccountScreen
-
         self.push_screen(AccountScreen())
 
     def action_switch_settings(self) -> None:
         """Switch to settings screen."""
-        from tui.screens.settings import SettingsScreen
-
         self.push_screen(SettingsScreen())
 
     def switch_to_main(self) -> None:
         """Navigate to main generation screen."""
-        from tui.screens.main import MainScreen
-
         self.switch_screen(MainScreen())
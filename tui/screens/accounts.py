@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import shutil
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
@@ -9,6 +11,7 @@ from textual.screen import Screen
 from textual.widgets import DataTable, Footer, Header, Input, Static, Button
 
 from gemini_automation.accounts import AccountManager
+from tui.screens.login import LoginScreen
 
 
 class AccountScreen(Screen):
@@ -22,9 +25,10 @@ class AccountScreen(Screen):
         Binding("o", "logout_account", "Logout", show=True),
     ]
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.account_mgr = AccountManager()
+    @property
+    def account_mgr(self) -> AccountManager:
+        """The app's shared account manager."""
+        return self.app.account_mgr
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -124,8 +128,6 @@ class AccountScreen(Screen):
         if not name:
             self.notify("Select an account first", severity="warning")
             return
-        from tui.screens.login import LoginScreen
-
         self.app.push_screen(LoginScreen(account_name=name))
 
     def action_logout_account(self) -> None:
@@ -134,8 +136,6 @@ class AccountScreen(Screen):
         if not name:
             self.notify("Select an account first", severity="warning")
             return
-        import shutil
-
         profile_dir = self.account_mgr.get_profile_dir(name)
         if profile_dir.exists():
             try:
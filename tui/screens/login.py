@@ -8,7 +8,6 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Static
 
-from gemini_automation.accounts import AccountManager
 from gemini_automation.browser import BrowserManager
 from gemini_automation.config import Config
 
@@ -25,6 +24,8 @@ class LoginScreen(Screen):
         super().__init__()
         self.account_name = account_name
         self._bm: BrowserManager | None = None
+        # Set once login is confirmed; further ENTER presses are ignored
+        self._login_confirmed = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -58,22 +59,28 @@ class LoginScreen(Screen):
             status = self.query_one("#login-status", Static)
             status.update(f"Error opening browser: {e}")
 
-    @work(thread=False)
+    @work(thread=False, exclusive=True, group="login_check")
     async def _check_and_close(self) -> None:
-        """Check login status, close browser, return to previous screen."""
+        """Check login status, close browser, return to previous screen.
+
+        Exclusive: pressing ENTER again cancels a check still in progress,
+        so only one check ever talks to the browser.
+        """
         status = self.query_one("#login-status", Static)
-        if not self._bm:
+        bm = self._bm
+        if bm is None:
             status.update("Browser not ready. Wait a moment and try again.")
             return
 
         try:
-            page = await self._bm.get_page()
-            logged_in = await self._bm.is_logged_in(page)
+            page = await bm.get_page()
+            logged_in = await bm.is_logged_in(page)
             if logged_in:
                 status.update("Login successful! Closing browser...")
-                AccountManager().update_last_used(self.account_name)
-                await self._bm.close()
+                self._login_confirmed = True
+                self.app.account_mgr.update_last_used(self.account_name)
                 self._bm = None
+                await bm.close()
                 self.notify(
                     f"Logged in as '{self.account_name}'", severity="information"
                 )
@@ -87,14 +94,17 @@ class LoginScreen(Screen):
 
     def action_confirm_login(self) -> None:
         """User confirms they finished logging in."""
+        # A new check would cancel the one already closing the browser
+        if self._login_confirmed:
+            return
         self._check_and_close()
 
     @work(thread=False)
     async def _close_browser(self) -> None:
         """Close browser without checking login."""
-        if self._bm:
-            await self._bm.close()
-            self._bm = None
+        bm, self._bm = self._bm, None
+        if bm:
+            await bm.close()
 
     def action_cancel_login(self) -> None:
         """Cancel login and return."""
@@ -2,22 +2,35 @@
 
 from __future__ import annotations
 
-import uuid
-from dataclasses import dataclass, field
+import asyncio
+from dataclasses import dataclass, replace
+from pathlib import Path
 
-from textual import work
+from playwright.async_api import BrowserContext
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Footer, Header, Input, Static
-from textual.worker import get_current_worker
 
-from gemini_automation.accounts import AccountManager
-from gemini_automation.browser import BrowserManager
+from gemini_automation.browser import is_logged_in
+from gemini_automation.browser_pool import BrowserPool
 from gemini_automation.config import Config
 from gemini_automation.downloader import ImageDownloader
-from gemini_automation.generator import GenerationResult, ImageGenerator
+from gemini_automation.generator import ImageGenerator
+from tui.screens.batch import BatchScreen
+
+# Table and status-bar writes are coalesced and applied at most once per
+# frame (~60 Hz)
+_FLUSH_INTERVAL = 1 / 60
+# Finished tasks' last_used timestamps are saved together, this often (s)
+_LAST_USED_FLUSH_INTERVAL = 1.0
+_PROMPT_COLUMN_WIDTH = 45
+
+
+def _clip(text: str, width: int = _PROMPT_COLUMN_WIDTH) -> str:
+    """``text`` cut to ``width`` characters, ending in "..." if it was cut."""
+    return text if len(text) <= width else f"{text[:width - 3]}..."
 
 
 @dataclass
@@ -27,6 +40,11 @@ class QueueItem:
     id: str
     prompt: str
     account_name: str
+    # Settings as they were when the item was queued
+    min_delay: float
+    max_delay: float
+    generation_timeout: float
+    output_dir: Path
     status: str = "Pending"
     error: str | None = None
     image_count: int = 0
@@ -44,8 +62,31 @@ class MainScreen(Screen):
 
     def __init__(self) -> None:
         super().__init__()
-        self._queue: list[QueueItem] = []
-        self._is_processing = False
+        # Every task by ID, in the order added (dict keeps insertion order)
+        self._queue: dict[str, QueueItem] = {}
+        # Items waiting to run, taken by app.max_parallel queue workers
+        self._task_queue: asyncio.Queue[QueueItem] = asyncio.Queue()
+        self._running_tasks: dict[str, asyncio.Task] = {}
+        self._account_locks: dict[str, asyncio.Lock] = {}
+        # One browser context per account, shared by all of its tasks (each
+        # task opens its own tab) and closed when the screen goes away
+        self._pool = BrowserPool()
+        self._contexts: dict[str, tuple[BrowserContext, Config]] = {}
+        self._worker_count = 0
+        # Workers currently waiting on _task_queue (safe to stop)
+        self._idle_workers: set[asyncio.Task] = set()
+        # Task IDs are a per-screen counter (row keys only need uniqueness)
+        self._next_id = 0
+        self._configs: dict[tuple[str, Path], Config] = {}
+        # Accounts whose last_used is due to be saved by the next flush
+        self._touched_accounts: set[str] = set()
+        # Kept in step with item statuses so the status bar never has to
+        # scan the whole queue (which made batch imports quadratic)
+        self._pending_count = 0
+        # Cell writes waiting for the next flush, latest value per cell
+        self._pending_updates: dict[tuple[str, str], str] = {}
+        self._status_dirty = False
+        self._flush_scheduled = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -59,130 +100,259 @@ class MainScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize the queue table."""
-        table = self.query_one("#queue-table", DataTable)
+        # Widget handles, looked up once rather than on every update
+        self._table = table = self.query_one("#queue-table", DataTable)
+        self._status_bar = self.query_one("#status-bar", Static)
+        self._prompt_input = self.query_one("#prompt-input", Input)
+        self._refresh_status_prefix()
         table.add_column("ID", key="id", width=10)
-        table.add_column("Prompt", key="prompt", width=45)
+        table.add_column("Prompt", key="prompt", width=_PROMPT_COLUMN_WIDTH)
         table.add_column("Account", key="account", width=15)
         table.add_column("Status", key="status", width=20)
         table.add_column("Images", key="images", width=8)
         table.zebra_stripes = True
         self._update_status_bar()
+        self._resize_queue_workers()
+
+    def on_screen_resume(self) -> None:
+        """Pick up a changed account or Parallel Tasks setting."""
+        self._refresh_status_prefix()
+        if self.is_mounted:
+            self._update_status_bar()
+        self._resize_queue_workers()
+
+    def _refresh_status_prefix(self) -> None:
+        """Rebuild the fixed start of the status bar (the current account)."""
+        account = self.app.current_account or "None"
+        self._status_prefix = f"Account: {account} | Queue: "
+
+    def _resize_queue_workers(self) -> None:
+        """Run app.max_parallel queue workers (never fewer than one).
+
+        Surplus idle workers are stopped at once; busy ones exit after
+        their current item.
+        """
+        target = max(1, self.app.max_parallel)
+        while self._worker_count < target:
+            self.run_worker(self._queue_worker(), group="queue")
+            self._worker_count += 1
+        while self._worker_count > target and self._idle_workers:
+            self._idle_workers.pop().cancel()
+            self._worker_count -= 1
 
     def _update_status_bar(self) -> None:
         """Refresh the status bar."""
-        account = self.app.current_account or "None"
-        pending = sum(1 for q in self._queue if q.status == "Pending")
-        total = len(self._queue)
-        bar = self.query_one("#status-bar", Static)
-        bar.update(f"Account: {account} | Queue: {pending} pending / {total} total")
+        self._status_bar.update(
+            f"{self._status_prefix}{self._pending_count} pending / {len(self._queue)} total"
+        )
+
+    def _schedule_flush(self) -> None:
+        """Apply queued cell updates and redraw the status bar next frame."""
+        self._status_dirty = True
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.set_timer(_FLUSH_INTERVAL, self._flush_updates)
+
+    def _flush_updates(self) -> None:
+        """Write all queued cell updates, then redraw the status bar once."""
+        self._flush_scheduled = False
+        if self._pending_updates:
+            updates, self._pending_updates = self._pending_updates, {}
+            table = self._table
+            for (task_id, column), value in updates.items():
+                try:
+                    table.update_cell(task_id, column, value)
+                except Exception:
+                    pass  # row was deleted before the flush
+        if self._status_dirty:
+            self._status_dirty = False
+            self._update_status_bar()
+
+    def _set_status(self, item: QueueItem, status: str) -> None:
+        """Set ``item``'s status, keeping the pending count in step."""
+        self._pending_count += (status == "Pending") - (item.status == "Pending")
+        item.status = status
 
     def _add_to_queue(self, prompt: str) -> None:
         """Add a prompt to the generation queue."""
-        account = self.app.current_account
-        if not account:
-            self.notify("No account selected. Press Ctrl+A.", severity="error")
-            return
-
-        task_id = uuid.uuid4().hex[:8]
-        item = QueueItem(id=task_id, prompt=prompt, account_name=account)
-        self._queue.append(item)
+        self._add_many_to_queue([prompt])
 
-        table = self.query_one("#queue-table", DataTable)
-        display_prompt = prompt[:45] + "..." if len(prompt) > 45 else prompt
-        table.add_row(task_id, display_prompt, account, "Pending", "0", key=task_id)
-        self._update_status_bar()
+    def _add_many_to_queue(self, prompts: list[str]) -> int:
+        """Add prompts to the generation queue; returns how many were added.
 
-        # Start processing if idle
-        if not self._is_processing:
-            self._process_next()
-
-    def _get_next_pending(self) -> QueueItem | None:
-        """Get the next pending item from the queue."""
-        for item in self._queue:
-            if item.status == "Pending":
-                return item
-        return None
+        The rows go into the table in one batched update, and the status
+        bar is refreshed once for the whole lot.
+        """
+        app = self.app
+        account = app.current_account
+        if not account:
+            self.notify("No account selected. Press Ctrl+A.", severity="error")
+            return 0
+
+        min_delay, max_delay = app.min_delay, app.max_delay
+        generation_timeout, output_dir = app.generation_timeout, app.output_dir
+        first_id = self._next_id + 1
+        self._next_id += len(prompts)
+        items = [
+            QueueItem(
+                id=f"{task_num:08x}",
+                prompt=prompt,
+                account_name=account,
+                min_delay=min_delay,
+                max_delay=max_delay,
+                generation_timeout=generation_timeout,
+                output_dir=output_dir,
+            )
+            for task_num, prompt in enumerate(prompts, first_id)
+        ]
+        table = self._table
+        rows = [
+            (item.id, _clip(item.prompt), account, "Pending", "0") for item in items
+        ]
+        with app.batch_update():
+            for row in rows:
+                table.add_row(*row, key=row[0])
+        self._queue.update((item.id, item) for item in items)
+        self._pending_count += len(items)
+        self._schedule_flush()
+        for item in items:
+            self._task_queue.put_nowait(item)
+        return len(items)
 
     def _update_task(self, task_id: str, status: str, images: int = 0) -> None:
-        """Update a task's status in the DataTable."""
-        table = self.query_one("#queue-table", DataTable)
-        try:
-            table.update_cell(task_id, "status", status)
-            table.update_cell(task_id, "images", str(images))
-        except Exception:
-            pass
-        # Update queue item
-        for item in self._queue:
-            if item.id == task_id:
-                item.status = status
+        """Update a task's status; the DataTable catches up on the next flush."""
+        self._pending_updates[(task_id, "status")] = status
+        # Update queue item; the Images cell only changes with the count
+        item = self._queue.get(task_id)
+        if item is not None:
+            self._set_status(item, status)
+            if item.image_count != images:
                 item.image_count = images
-                break
-        self._update_status_bar()
-
-    def _process_next(self) -> None:
-        """Start processing the next pending item."""
-        item = self._get_next_pending()
-        if item:
-            self._is_processing = True
-            self._run_generation(item)
-        else:
-            self._is_processing = False
-
-    @work(thread=False, exclusive=False)
-    async def _run_generation(self, item: QueueItem) -> str:
+                self._pending_updates[(task_id, "images")] = str(images)
+        self._schedule_flush()
+
+    def _touch_account(self, account_name: str) -> None:
+        """Mark the account as used; saved at most once a second."""
+        if not self._touched_accounts:
+            self.set_timer(_LAST_USED_FLUSH_INTERVAL, self._flush_last_used)
+        self._touched_accounts.add(account_name)
+
+    async def _flush_last_used(self) -> None:
+        """Save last_used for every account touched since the last flush."""
+        if self._touched_accounts:
+            names, self._touched_accounts = self._touched_accounts, set()
+            # File write off the event loop, so the UI and other tasks go on
+            await asyncio.to_thread(self.app.account_mgr.update_last_used, *names)
+
+    async def on_unmount(self) -> None:
+        """Hand back the accounts' browser contexts and close them."""
+        await self._flush_last_used()
+        for context, config in list(self._contexts.values()):
+            await self._pool.release(context, config)
+        self._contexts.clear()
+        await self._pool.close()
+
+    def _account_lock(self, account_name: str) -> asyncio.Lock:
+        """Lock guarding the launch of one account's browser context."""
+        lock = self._account_locks.get(account_name)
+        if lock is None:
+            lock = self._account_locks[account_name] = asyncio.Lock()
+        return lock
+
+    async def _config_for(self, item: QueueItem) -> Config:
+        """A Config for ``item``, carrying the settings it was queued with.
+
+        One base Config is kept per (account, output dir), so its
+        directories are only created the first time; each item gets its
+        own copy so tasks queued under different settings don't share one.
+        """
+        key = (item.account_name, item.output_dir)
+        config = self._configs.get(key)
+        if config is None:
+            config = Config.for_account(item.account_name)
+            config.output_dir = item.output_dir
+            await asyncio.to_thread(config.ensure_dirs)
+            self._configs[key] = config
+        return replace(
+            config,
+            min_delay=item.min_delay,
+            max_delay=item.max_delay,
+            generation_timeout=item.generation_timeout,
+        )
+
+    async def _get_context(self, config: Config) -> BrowserContext | None:
+        """The account's shared browser context, launched on first use.
+
+        The login check runs once, when the context is launched. Returns
+        None (and closes the browser) if the account is not logged in.
+        """
+        name = config.account_name
+        async with self._account_lock(name):
+            entry = self._contexts.get(name)
+            if entry is not None:
+                return entry[0]
+            context = await self._pool.acquire(config)
+            page = context.pages[0] if context.pages else await context.new_page()
+            if not await is_logged_in(page, config):
+                await self._pool.release(context, config, discard=True)
+                return None
+            self._contexts[name] = (context, config)
+            context.on("close", lambda _: self._contexts.pop(name, None))
+            return context
+
+    async def _queue_worker(self) -> None:
+        """Take items off the task queue and run them one at a time.
+
+        Exits once there are more workers than app.max_parallel allows.
+        """
+        current = asyncio.current_task()
+        while self._worker_count <= max(1, self.app.max_parallel):
+            self._idle_workers.add(current)
+            try:
+                item = await self._task_queue.get()
+            finally:
+                self._idle_workers.discard(current)
+            # Deleted (or cancelled) while it waited
+            if item.status != "Pending":
+                continue
+            task = asyncio.create_task(self._run_generation(item))
+            self._running_tasks[item.id] = task
+            try:
+                # wait() rather than await: cancelling the item must not
+                # end this worker
+                await asyncio.wait({task})
+            finally:
+                self._running_tasks.pop(item.id, None)
+                if not task.done():
+                    task.cancel()
+        self._worker_count -= 1
+
+    async def _run_generation(self, item: QueueItem) -> None:
         """Run image generation for a single queue item."""
-        worker = get_current_worker()
         task_id = item.id
-
-        config = Config.for_account(item.account_name)
-        config.min_delay = self.app.min_delay
-        config.max_delay = self.app.max_delay
-        config.generation_timeout = self.app.generation_timeout
-        config.output_dir = self.app.output_dir
-        config.ensure_dirs()
-
-        bm = BrowserManager(config)
+        page = None
+        downloader = None
         try:
-            # Launch browser
-            self._update_task(task_id, "Launching...")
-            await bm.launch()
+            config = await self._config_for(item)
 
-            if worker.is_cancelled:
-                self._update_task(task_id, "Cancelled")
-                await bm.close()
-                return "Cancelled"
-
-            # Check login
-            self._update_task(task_id, "Checking login...")
-            page = await bm.get_page()
-            if not await bm.is_logged_in(page):
+            # Reuse (or launch) the account's browser; each task gets a tab.
+            # Shielded: the launch is shared with the account's other tasks,
+            # so cancelling this one must not abort it halfway.
+            self._update_task(task_id, "Launching...")
+            context = await asyncio.shield(self._get_context(config))
+            if context is None:
                 self._update_task(task_id, "Not logged in!")
-                await bm.close()
-                self._is_processing = False
-                self._process_next()
-                return "Not logged in"
-
-            if worker.is_cancelled:
-                self._update_task(task_id, "Cancelled")
-                await bm.close()
-                return "Cancelled"
+                return
+            page = await context.new_page()
 
             # Generate image
             self._update_task(task_id, "Generating...")
             generator = ImageGenerator(page, config)
             result = await generator.generate(item.prompt)
 
-            if worker.is_cancelled:
-                self._update_task(task_id, "Cancelled")
-                await bm.close()
-                return "Cancelled"
-
             if not result.success:
                 self._update_task(task_id, f"Failed: {result.error}")
-                await bm.close()
-                self._is_processing = False
-                self._process_next()
-                return f"Failed: {result.error}"
+                return
 
             # Download images
             self._update_task(task_id, "Downloading...")
@@ -192,30 +362,27 @@ class MainScreen(Screen):
             image_count = len(dl_result.saved_files)
             self._update_task(task_id, "Done ✓", image_count)
 
-            # Update last used
-            AccountManager().update_last_used(item.account_name)
-
-            await bm.close()
+            # Update last used (written out with other finished tasks')
+            self._touch_account(item.account_name)
 
             self.notify(
                 f"Generated {image_count} image(s) for: {item.prompt[:30]}",
                 severity="information",
             )
 
-            # Process next in queue
-            self._is_processing = False
-            self._process_next()
-            return "Success"
-
+        except asyncio.CancelledError:
+            self._update_task(task_id, "Cancelled")
+            raise
         except Exception as e:
             self._update_task(task_id, f"Error: {e}")
-            try:
-                await bm.close()
-            except Exception:
-                pass
-            self._is_processing = False
-            self._process_next()
-            return f"Error: {e}"
+        finally:
+            if downloader is not None:
+                await downloader.close()
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
     # --- Actions ---
 
@@ -231,7 +398,7 @@ class MainScreen(Screen):
 
     def action_new_prompt(self) -> None:
         """Submit the current prompt."""
-        prompt_input = self.query_one("#prompt-input", Input)
+        prompt_input = self._prompt_input
         prompt = prompt_input.value.strip()
         if not prompt:
             self.notify("Enter a prompt first", severity="warning")
@@ -242,19 +409,16 @@ class MainScreen(Screen):
 
     def action_open_batch(self) -> None:
         """Open batch prompt dialog."""
-        from tui.screens.batch import BatchScreen
 
         def on_batch_result(prompts: list[str] | None) -> None:
-            if prompts:
-                for p in prompts:
-                    self._add_to_queue(p)
+            if prompts and self._add_many_to_queue(prompts):
                 self.notify(f"Added {len(prompts)} prompts to queue")
 
         self.app.push_screen(BatchScreen(), callback=on_batch_result)
 
     def action_delete_task(self) -> None:
         """Delete selected task if pending."""
-        table = self.query_one("#queue-table", DataTable)
+        table = self._table
         if table.row_count == 0:
             return
         try:
@@ -264,26 +428,21 @@ class MainScreen(Screen):
             return
 
         # Only delete if pending
-        for item in self._queue:
-            if item.id == task_id and item.status == "Pending":
-                self._queue.remove(item)
-                table.remove_row(row_key)
-                self._update_status_bar()
-                self.notify(f"Deleted task {task_id}")
-                return
+        item = self._queue.get(task_id)
+        if item is not None and item.status == "Pending":
+            # Still in the task queue; workers skip it once it's not Pending
+            self._set_status(item, "Deleted")
+            del self._queue[task_id]
+            table.remove_row(row_key)
+            self._update_status_bar()
+            self.notify(f"Deleted task {task_id}")
+            return
         self.notify("Can only delete pending tasks", severity="warning")
 
     def action_cancel_task(self) -> None:
-        """Cancel running task."""
-        self.workers.cancel_all()
-        for item in self._queue:
-            if item.status in (
-                "Launching...",
-                "Checking login...",
-                "Generating...",
-                "Downloading...",
-            ):
-                item.status = "Cancelled"
-                self._update_task(item.id, "Cancelled")
-        self._is_processing = False
+        """Cancel running tasks; their workers move on to the next item."""
+        # Only the running items are visited, not the whole queue
+        for task_id, task in self._running_tasks.items():
+            task.cancel()
+            self._update_task(task_id, "Cancelled")
         self.notify("Cancelled running tasks")
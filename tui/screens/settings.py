@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
+from textual.validation import Integer, Number
 from textual.widgets import Button, Footer, Header, Input, Label, Static
 
 
+def _parallel_tasks(value: str) -> int:
+    return max(1, int(value))
+
+
+# Input id -> parser; each parsed value is stored on the app attribute of
+# the same name
+_SETTINGS = (
+    ("min_delay", float),
+    ("max_delay", float),
+    ("generation_timeout", float),
+    ("max_parallel", _parallel_tasks),
+    ("output_dir", Path),
+)
+
+
 class SettingsScreen(Screen):
     """Configure generation settings."""
 
@@ -25,21 +43,32 @@ class SettingsScreen(Screen):
                 yield Input(
                     value=str(self.app.min_delay),
                     id="min_delay",
-                    type="number",
+                    validators=[Number()],
+                    validate_on=["submitted"],
                 )
             with Horizontal(classes="setting-row"):
                 yield Label("Max Delay (s):")
                 yield Input(
                     value=str(self.app.max_delay),
                     id="max_delay",
-                    type="number",
+                    validators=[Number()],
+                    validate_on=["submitted"],
                 )
             with Horizontal(classes="setting-row"):
                 yield Label("Timeout (ms):")
                 yield Input(
                     value=str(self.app.generation_timeout),
                     id="generation_timeout",
-                    type="number",
+                    validators=[Number()],
+                    validate_on=["submitted"],
+                )
+            with Horizontal(classes="setting-row"):
+                yield Label("Parallel Tasks:")
+                yield Input(
+                    value=str(self.app.max_parallel),
+                    id="max_parallel",
+                    validators=[Integer(minimum=1)],
+                    validate_on=["submitted"],
                 )
             with Horizontal(classes="setting-row"):
                 yield Label("Output Dir:")
@@ -52,6 +81,12 @@ class SettingsScreen(Screen):
                 yield Button("Back", id="back-btn")
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Look up the setting inputs once."""
+        self._inputs = {
+            name: self.query_one(f"#{name}", Input) for name, _ in _SETTINGS
+        }
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "save-btn":
             self._save_settings()
@@ -59,20 +94,22 @@ class SettingsScreen(Screen):
             self.action_go_back()
 
     def _save_settings(self) -> None:
-        """Save settings to app state."""
-        from pathlib import Path
+        """Save settings to app state.
 
+        Every value is parsed before any is stored, so an invalid entry
+        leaves all settings unchanged.
+        """
         try:
-            self.app.min_delay = float(self.query_one("#min_delay", Input).value)
-            self.app.max_delay = float(self.query_one("#max_delay", Input).value)
-            self.app.generation_timeout = float(
-                self.query_one("#generation_timeout", Input).value
-            )
-            self.app.output_dir = Path(self.query_one("#output_dir", Input).value)
-            self.notify("Settings saved", severity="information")
-            self.app.pop_screen()
+            values = {
+                name: parse(self._inputs[name].value) for name, parse in _SETTINGS
+            }
         except ValueError as e:
             self.notify(f"Invalid value: {e}", severity="error")
+            return
+        for name, value in values.items():
+            setattr(self.app, name, value)
+        self.notify("Settings saved", severity="information")
+        self.app.pop_screen()
 
     def action_go_back(self) -> None:
         self.app.pop_screen()